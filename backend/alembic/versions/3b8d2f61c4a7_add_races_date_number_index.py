@@ -0,0 +1,28 @@
+"""Add composite index on races (race_date, race_number, id)
+
+Revision ID: 3b8d2f61c4a7
+Revises: e69f4a38ae38
+Create Date: 2026-10-15 10:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8d2f61c4a7'
+down_revision: Union[str, Sequence[str], None] = 'e69f4a38ae38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_races_race_date_race_number', 'races', ['race_date', 'race_number', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_races_race_date_race_number', table_name='races')
@@ -0,0 +1,54 @@
+"""Add race_entries.finish_time_cs (finish time in centiseconds)
+
+Revision ID: 4c6e8a1d2b93
+Revises: d81b3f5a6c27
+Create Date: 2026-10-15 15:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c6e8a1d2b93'
+down_revision: Union[str, Sequence[str], None] = 'd81b3f5a6c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _to_cs(finish_time):
+    # Mirrors models.finish_time_to_cs; migrations don't import application code
+    minutes, _, seconds = finish_time.strip().partition(':')
+    try:
+        return round((int(minutes) * 60 + float(seconds)) * 100)
+    except ValueError:
+        return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('race_entries', sa.Column('finish_time_cs', sa.Integer(), nullable=True))
+
+    # Backfill from the existing "M:SS.ff" strings
+    bind = op.get_bind()
+    entries = sa.table('race_entries', sa.column('id', sa.Integer), sa.column('finish_time', sa.String),
+                       sa.column('finish_time_cs', sa.Integer))
+    rows = bind.execute(
+        sa.select(entries.c.id, entries.c.finish_time).where(entries.c.finish_time.isnot(None))
+    ).all()
+    updates = [{'entry_id': row.id, 'cs': _to_cs(row.finish_time)} for row in rows]
+    if updates:
+        bind.execute(
+            entries.update().where(entries.c.id == sa.bindparam('entry_id')).values(finish_time_cs=sa.bindparam('cs')),
+            updates
+        )
+
+    op.create_index('ix_race_entries_horse_id_finish_time_cs', 'race_entries', ['horse_id', 'finish_time_cs'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_race_entries_horse_id_finish_time_cs', table_name='race_entries')
+    op.drop_column('race_entries', 'finish_time_cs')
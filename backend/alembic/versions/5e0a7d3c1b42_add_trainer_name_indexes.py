@@ -0,0 +1,53 @@
+"""Add trainer name indexes for active listings and substring search
+
+Revision ID: 5e0a7d3c1b42
+Revises: c27e4b9a0f18
+Create Date: 2026-10-15 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0a7d3c1b42'
+down_revision: Union[str, Sequence[str], None] = 'c27e4b9a0f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _pg_trgm_available() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+    return bind.execute(
+        sa.text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+    ).scalar()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_trainers_active_name', 'trainers', ['name'], unique=False,
+        postgresql_where=sa.text('active'),
+        sqlite_where=sa.text('active = 1')
+    )
+    # Trigram GIN index so ilike('%name%') can use an index instead of a sequential scan.
+    # Skipped where the server doesn't ship pg_trgm (contrib); searches then scan trainers.
+    if _pg_trgm_available():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            'ix_trainers_name_trgm', 'trainers', ['name'], unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_where=sa.text('active')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_trainers_name_trgm', table_name='trainers', if_exists=True)
+    op.drop_index('ix_trainers_active_name', table_name='trainers')
@@ -0,0 +1,46 @@
+"""Add trainer_stats_mv materialized view
+
+Revision ID: 8f1c5a2e9d30
+Revises: 3b8d2f61c4a7
+Create Date: 2026-10-15 11:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f1c5a2e9d30'
+down_revision: Union[str, Sequence[str], None] = '3b8d2f61c4a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Materialized views are Postgres-only; other backends keep aggregating live
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("""
+        CREATE MATERIALIZED VIEW trainer_stats_mv AS
+        SELECT trainer_id,
+               COUNT(id) AS total_starts,
+               SUM(CASE WHEN finish_position = 1 THEN 1 ELSE 0 END) AS wins,
+               SUM(CASE WHEN finish_position = 2 THEN 1 ELSE 0 END) AS places,
+               SUM(CASE WHEN finish_position = 3 THEN 1 ELSE 0 END) AS shows,
+               SUM(earnings) AS total_earnings
+        FROM race_entries
+        WHERE scratched = false
+        GROUP BY trainer_id
+    """)
+    # REFRESH ... CONCURRENTLY needs a unique index
+    op.execute("CREATE UNIQUE INDEX ix_trainer_stats_mv_trainer_id ON trainer_stats_mv (trainer_id)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS trainer_stats_mv")
@@ -0,0 +1,39 @@
+"""Add composite indexes for race filters and per-horse/driver/race entry lookups
+
+Revision ID: 9a4d6e2f7b15
+Revises: 5e0a7d3c1b42
+Create Date: 2026-10-15 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d6e2f7b15'
+down_revision: Union[str, Sequence[str], None] = '5e0a7d3c1b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_races_track_id_race_date', 'races', ['track_id', 'race_date'], unique=False)
+    op.create_index(
+        'ix_race_entries_driver_active', 'race_entries', ['driver_id'], unique=False,
+        postgresql_include=['finish_position', 'earnings'],
+        postgresql_where=sa.text('scratched = false'),
+        sqlite_where=sa.text('scratched = 0')
+    )
+    op.create_index('ix_race_entries_horse_id_race_id', 'race_entries', ['horse_id', 'race_id'], unique=False)
+    op.create_index('ix_race_entries_race_id_finish_position', 'race_entries', ['race_id', 'finish_position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_race_entries_race_id_finish_position', table_name='race_entries')
+    op.drop_index('ix_race_entries_horse_id_race_id', table_name='race_entries')
+    op.drop_index('ix_race_entries_driver_active', table_name='race_entries')
+    op.drop_index('ix_races_track_id_race_date', table_name='races')
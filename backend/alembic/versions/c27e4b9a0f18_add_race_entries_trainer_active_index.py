@@ -0,0 +1,33 @@
+"""Add partial covering index on race_entries (trainer_id) for unscratched entries
+
+Revision ID: c27e4b9a0f18
+Revises: 8f1c5a2e9d30
+Create Date: 2026-10-15 11:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c27e4b9a0f18'
+down_revision: Union[str, Sequence[str], None] = '8f1c5a2e9d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_race_entries_trainer_active', 'race_entries', ['trainer_id'], unique=False,
+        postgresql_include=['finish_position', 'earnings'],
+        postgresql_where=sa.text('scratched = false'),
+        sqlite_where=sa.text('scratched = 0')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_race_entries_trainer_active', table_name='race_entries')
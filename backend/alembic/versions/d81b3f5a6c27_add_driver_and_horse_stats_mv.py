@@ -0,0 +1,47 @@
+"""Add driver and horse stats materialized views for top-performer rankings
+
+Revision ID: d81b3f5a6c27
+Revises: 9a4d6e2f7b15
+Create Date: 2026-10-15 14:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81b3f5a6c27'
+down_revision: Union[str, Sequence[str], None] = '9a4d6e2f7b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Materialized views are Postgres-only; other backends keep aggregating live
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for key in ('driver_id', 'horse_id'):
+        view = f"{key[:-3]}_stats_mv"
+        op.execute(f"""
+            CREATE MATERIALIZED VIEW {view} AS
+            SELECT {key},
+                   COUNT(id) AS total_starts,
+                   SUM(CASE WHEN finish_position = 1 THEN 1 ELSE 0 END) AS wins,
+                   SUM(earnings) AS total_earnings
+            FROM race_entries
+            WHERE scratched = false
+            GROUP BY {key}
+        """)
+        # REFRESH ... CONCURRENTLY needs a unique index
+        op.execute(f"CREATE UNIQUE INDEX ix_{view}_{key} ON {view} ({key})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS horse_stats_mv")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS driver_stats_mv")
@@ -21,12 +21,162 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    pass
+    op.create_table('data_fetches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=100), nullable=False),
+    sa.Column('fetch_type', sa.String(length=50), nullable=False),
+    sa.Column('fetch_date', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('records_processed', sa.Integer(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_data_fetches_id'), 'data_fetches', ['id'], unique=False)
+    op.create_table('drivers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('license_number', sa.String(length=50), nullable=True),
+    sa.Column('birth_date', sa.Date(), nullable=True),
+    sa.Column('hometown', sa.String(length=100), nullable=True),
+    sa.Column('active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('license_number')
+    )
+    op.create_index(op.f('ix_drivers_id'), 'drivers', ['id'], unique=False)
+    op.create_index(op.f('ix_drivers_name'), 'drivers', ['name'], unique=False)
+    op.create_table('horses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('registration_number', sa.String(length=50), nullable=True),
+    sa.Column('foaling_date', sa.Date(), nullable=True),
+    sa.Column('sex', sa.String(length=10), nullable=True),
+    sa.Column('color', sa.String(length=20), nullable=True),
+    sa.Column('sire', sa.String(length=100), nullable=True),
+    sa.Column('dam', sa.String(length=100), nullable=True),
+    sa.Column('breeder', sa.String(length=100), nullable=True),
+    sa.Column('owner', sa.String(length=100), nullable=True),
+    sa.Column('active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_horses_id'), 'horses', ['id'], unique=False)
+    op.create_index(op.f('ix_horses_name'), 'horses', ['name'], unique=False)
+    op.create_index(op.f('ix_horses_registration_number'), 'horses', ['registration_number'], unique=True)
+    op.create_table('tracks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('location', sa.String(length=100), nullable=False),
+    sa.Column('surface', sa.String(length=20), nullable=True),
+    sa.Column('circumference', sa.Float(), nullable=True),
+    sa.Column('active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tracks_id'), 'tracks', ['id'], unique=False)
+    op.create_index(op.f('ix_tracks_name'), 'tracks', ['name'], unique=False)
+    op.create_table('trainers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('license_number', sa.String(length=50), nullable=True),
+    sa.Column('birth_date', sa.Date(), nullable=True),
+    sa.Column('hometown', sa.String(length=100), nullable=True),
+    sa.Column('active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('license_number')
+    )
+    op.create_index(op.f('ix_trainers_id'), 'trainers', ['id'], unique=False)
+    op.create_index(op.f('ix_trainers_name'), 'trainers', ['name'], unique=False)
+    op.create_table('races',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('track_id', sa.Integer(), nullable=False),
+    sa.Column('race_number', sa.Integer(), nullable=False),
+    sa.Column('race_date', sa.Date(), nullable=False),
+    sa.Column('post_time', sa.DateTime(), nullable=True),
+    sa.Column('distance', sa.Integer(), nullable=True),
+    sa.Column('purse', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('race_type', sa.String(length=50), nullable=True),
+    sa.Column('conditions', sa.Text(), nullable=True),
+    sa.Column('track_condition', sa.String(length=20), nullable=True),
+    sa.Column('weather', sa.String(length=50), nullable=True),
+    sa.Column('temperature', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['track_id'], ['tracks.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_races_id'), 'races', ['id'], unique=False)
+    op.create_index(op.f('ix_races_race_date'), 'races', ['race_date'], unique=False)
+    op.create_table('betting_pools',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('race_id', sa.Integer(), nullable=False),
+    sa.Column('bet_type', sa.String(length=20), nullable=False),
+    sa.Column('pool_total', sa.Numeric(precision=12, scale=2), nullable=True),
+    sa.Column('winning_combination', sa.String(length=50), nullable=True),
+    sa.Column('payout', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['race_id'], ['races.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_betting_pools_id'), 'betting_pools', ['id'], unique=False)
+    op.create_table('race_entries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('race_id', sa.Integer(), nullable=False),
+    sa.Column('horse_id', sa.Integer(), nullable=False),
+    sa.Column('driver_id', sa.Integer(), nullable=False),
+    sa.Column('trainer_id', sa.Integer(), nullable=False),
+    sa.Column('post_position', sa.Integer(), nullable=False),
+    sa.Column('program_number', sa.String(length=10), nullable=True),
+    sa.Column('morning_line_odds', sa.String(length=10), nullable=True),
+    sa.Column('final_odds', sa.String(length=10), nullable=True),
+    sa.Column('finish_position', sa.Integer(), nullable=True),
+    sa.Column('finish_time', sa.String(length=20), nullable=True),
+    sa.Column('margin', sa.String(length=20), nullable=True),
+    sa.Column('earnings', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('scratched', sa.Boolean(), nullable=True),
+    sa.Column('disqualified', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['driver_id'], ['drivers.id'], ),
+    sa.ForeignKeyConstraint(['horse_id'], ['horses.id'], ),
+    sa.ForeignKeyConstraint(['race_id'], ['races.id'], ),
+    sa.ForeignKeyConstraint(['trainer_id'], ['trainers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_race_entries_id'), 'race_entries', ['id'], unique=False)
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    pass
+    op.drop_index(op.f('ix_race_entries_id'), table_name='race_entries')
+    op.drop_table('race_entries')
+    op.drop_index(op.f('ix_betting_pools_id'), table_name='betting_pools')
+    op.drop_table('betting_pools')
+    op.drop_index(op.f('ix_races_race_date'), table_name='races')
+    op.drop_index(op.f('ix_races_id'), table_name='races')
+    op.drop_table('races')
+    op.drop_index(op.f('ix_trainers_name'), table_name='trainers')
+    op.drop_index(op.f('ix_trainers_id'), table_name='trainers')
+    op.drop_table('trainers')
+    op.drop_index(op.f('ix_tracks_name'), table_name='tracks')
+    op.drop_index(op.f('ix_tracks_id'), table_name='tracks')
+    op.drop_table('tracks')
+    op.drop_index(op.f('ix_horses_registration_number'), table_name='horses')
+    op.drop_index(op.f('ix_horses_name'), table_name='horses')
+    op.drop_index(op.f('ix_horses_id'), table_name='horses')
+    op.drop_table('horses')
+    op.drop_index(op.f('ix_drivers_name'), table_name='drivers')
+    op.drop_index(op.f('ix_drivers_id'), table_name='drivers')
+    op.drop_table('drivers')
+    op.drop_index(op.f('ix_data_fetches_id'), table_name='data_fetches')
+    op.drop_table('data_fetches')
     # ### end Alembic commands ###
@@ -1,6 +1,6 @@
-from sqlalchemy import create_engine
+from sqlalchemy import BigInteger, case, cast, column, create_engine, func, select, table, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import raiseload, sessionmaker
 import os
 from dotenv import load_dotenv
 
@@ -9,11 +9,26 @@ load_dotenv()
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./harness_racing.db")
 
+# Outside production, list queries raise on lazy loads so N+1 regressions fail loudly
+APP_ENV = os.getenv("APP_ENV", "production")
+STRICT_LOADING = APP_ENV in ("development", "test")
+
 # Create engine
 if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 else:
-    engine = create_engine(DATABASE_URL)
+    # Sized per worker: the default 4 workers x (10 + 10) stays under Postgres' default
+    # max_connections of 100. LIFO checkout keeps a small set of connections warm so idle
+    # ones age out via pool_recycle; pre_ping replaces connections the server dropped.
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+        connect_args={"application_name": "hra-api"} if DATABASE_URL.startswith("postgresql") else {}
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -24,4 +39,71 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def check_schema_revision():
+    """Raise RuntimeError when the database is not at the Alembic head revision.
+
+    create_all never adds columns to existing tables, so a stale schema otherwise surfaces
+    later as "no such column" errors on the first query that touches a new column.
+    """
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+    head = ScriptDirectory.from_config(config).get_current_head()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    if current != head:
+        raise RuntimeError(
+            f"Database schema is at revision {current or 'none'}, expected {head}; "
+            "run `python -m alembic upgrade head` from backend/"
+        )
+
+def strict_loading_options() -> list:
+    """Loader options for list queries: raiseload('*') when STRICT_LOADING is on, nothing otherwise"""
+    return [raiseload('*')] if STRICT_LOADING else []
+
+def estimated_count_expression(db, table_name: str, exact):
+    """Planner row estimate for a whole table from pg_class, as a column expression so several
+    counts can share one SELECT.
+
+    Falls back to the exact count subquery when no estimate is available (always off Postgres, and
+    while reltuples is -1 before the first vacuum/analyze); Postgres only evaluates that fallback
+    when the estimate is NULL.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return exact
+    # to_regclass resolves the name through search_path, so a same-named index, view or table
+    # in another schema can't stand in for it; an unknown name yields no row and the exact count
+    pg_class = table("pg_class", column("oid"), column("reltuples"))
+    estimate = select(case((pg_class.c.reltuples >= 0, cast(pg_class.c.reltuples, BigInteger))))\
+        .where(pg_class.c.oid == func.to_regclass(table_name))\
+        .scalar_subquery()
+    return func.coalesce(estimate, exact)
+
+def materialized_view_exists(db, name: str) -> bool:
+    """Whether a Postgres materialized view is present; always False on other backends"""
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return db.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = :name)"),
+        {"name": name}
+    ).scalar()
+
+# materialized_view_exists results, checked once per (engine, view)
+_views_checked = {}
+
+def use_materialized_view(db, name: str) -> bool:
+    """Cached materialized_view_exists; views only appear through migrations"""
+    key = (db.get_bind(), name)
+    if key not in _views_checked:
+        _views_checked[key] = materialized_view_exists(db, name)
+    return _views_checked[key]
+
+def refresh_materialized_view(db, name: str):
+    """REFRESH ... CONCURRENTLY a view when it exists; a no-op otherwise"""
+    if use_materialized_view(db, name):
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+        db.commit()
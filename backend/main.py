@@ -1,13 +1,19 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import func, select
+from typing import List, Literal, Optional
 import uvicorn
 from datetime import datetime, date
+import hashlib
 import logging
+import os
+import warnings
 
-from database import get_db, engine
+from database import check_schema_revision, get_db, engine
 from models import Base
 from schemas import *
 from services.race_service import RaceService
@@ -17,13 +23,31 @@ from services.trainer_service import TrainerService
 from services.analytics_service import AnalyticsService
 from services.data_fetcher import DataFetcher
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+try:
+    # Optional binary encoding for export clients that send Accept: application/msgpack
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Schema is managed by Alembic (`alembic upgrade head`). CREATE_TABLES=1 is only for throwaway
+# databases; stamp one with `alembic stamp head` before running migrations against it.
+if os.getenv("CREATE_TABLES") == "1":
+    Base.metadata.create_all(bind=engine)
+
+# Recent FastAPI releases deprecate ORJSONResponse: endpoints with a response_model can have
+# pydantic write JSON bytes directly. About half of ours (/api/data, /api/system, ...) return
+# plain dicts with no response_model, and orjson still encodes those faster than json.dumps; on
+# the typed endpoints both paths measured the same. The class stays until those dict endpoints
+# get response models, and its warning (raised on every response) is silenced meanwhile.
+warnings.filterwarnings("ignore", message="ORJSONResponse is deprecated")
 
 app = FastAPI(
     title="Ontario Harness Racing Analytics API",
     description="Comprehensive analytics API for harness racing in Ontario, Canada",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -35,10 +59,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger JSON lists; tiny bodies aren't worth the CPU (or can grow when gzipped)
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _wants_msgpack(request: Request, response: Response) -> bool:
+    """Content negotiation for list endpoints; JSON unless msgpack is asked for and available"""
+    response.headers["Vary"] = "Accept"
+    return ormsgpack is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+def _msgpack_response(items) -> Response:
+    # Same field encoding as the JSON body (dates as ISO strings)
+    content = ormsgpack.packb([item.model_dump(mode="json") for item in items])
+    return Response(content=content, media_type=MSGPACK_MEDIA_TYPE, headers={"Vary": "Accept"})
+
+def _conditional(request: Request, response: Response, item):
+    """ETag a detail body and answer 304 when the client already holds it"""
+    # Hash the body rather than updated_at: tracks have none, and raw-SQL ingestion doesn't bump it
+    etag = '"%s"' % hashlib.md5(item.model_dump_json().encode(), usedforsecurity=False).hexdigest()
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    if etag in {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return item
+
+def _check_cursor(**parts):
+    """Reject a partial keyset cursor instead of silently serving the first page"""
+    given = [value is not None for value in parts.values()]
+    if any(given) and not all(given):
+        raise HTTPException(status_code=422, detail=f"Cursor requires {', '.join(parts)} together")
+
 # Initialize services
 race_service = RaceService()
 horse_service = HorseService()
@@ -47,6 +100,21 @@ trainer_service = TrainerService()
 analytics_service = AnalyticsService()
 data_fetcher = DataFetcher()
 
+@app.on_event("startup")
+async def startup_event():
+    # Throwaway create_all databases carry no Alembic revision to check
+    if os.getenv("CREATE_TABLES") != "1":
+        check_schema_revision()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    from services.web_scraper import close_scraper
+    from services.ontario_racing_api import close_ontario_service
+    from services.analytics_service import close_dashboard_pool
+    await close_scraper()
+    await close_ontario_service()
+    close_dashboard_pool()
+
 @app.get("/")
 async def root():
     return {"message": "Ontario Harness Racing Analytics API", "version": "1.0.0"}
@@ -55,19 +123,32 @@ async def root():
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now()}
 
+# Endpoints that only talk to the database are plain `def`: FastAPI runs them in its threadpool,
+# so a blocking query no longer holds up the event loop (and every other request) while it runs.
+
 # Race endpoints
 @app.get("/api/races", response_model=List[RaceResponse])
-async def get_races(
+def get_races(
+    request: Request,
+    response: Response,
     date: Optional[date] = Query(None, description="Filter by race date"),
     track_id: Optional[int] = Query(None, description="Filter by track"),
     limit: int = Query(50, le=100),
+    after_date: Optional[date] = Query(None, description="Cursor: race date of the last race on the previous page"),
+    after_race_number: Optional[int] = Query(None, description="Cursor: race number of the last race on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last race on the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get races with optional filtering"""
-    return race_service.get_races(db, date=date, track_id=track_id, limit=limit)
+    """Get races with optional filtering (msgpack with Accept: application/msgpack)"""
+    _check_cursor(after_date=after_date, after_race_number=after_race_number, after_id=after_id)
+    races = race_service.get_races(db, date=date, track_id=track_id, limit=limit,
+                                   after_date=after_date, after_race_number=after_race_number, after_id=after_id)
+    if _wants_msgpack(request, response):
+        return _msgpack_response(races)
+    return races
 
 @app.get("/api/races/{race_id}", response_model=RaceDetailResponse)
-async def get_race(race_id: int, db: Session = Depends(get_db)):
+def get_race(race_id: int, db: Session = Depends(get_db)):
     """Get detailed race information"""
     race = race_service.get_race_by_id(db, race_id)
     if not race:
@@ -75,113 +156,126 @@ async def get_race(race_id: int, db: Session = Depends(get_db)):
     return race
 
 @app.get("/api/races/today", response_model=List[RaceResponse])
-async def get_today_races(db: Session = Depends(get_db)):
+def get_today_races(db: Session = Depends(get_db)):
     """Get today's races"""
     return race_service.get_races(db, date=date.today())
 
 @app.get("/api/races/{race_id}/results", response_model=List[RaceResultResponse])
-async def get_race_results(race_id: int, db: Session = Depends(get_db)):
+def get_race_results(race_id: int, db: Session = Depends(get_db)):
     """Get race results"""
     return race_service.get_race_results(db, race_id)
 
 # Horse endpoints
 @app.get("/api/horses", response_model=List[HorseResponse])
-async def get_horses(
+def get_horses(
     name: Optional[str] = Query(None, description="Search by horse name"),
     limit: int = Query(50, le=100),
+    after_name: Optional[str] = Query(None, description="Cursor: name of the last horse on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last horse on the previous page"),
     db: Session = Depends(get_db)
 ):
     """Get horses with optional name search"""
-    return horse_service.get_horses(db, name=name, limit=limit)
+    _check_cursor(after_name=after_name, after_id=after_id)
+    return horse_service.get_horses(db, name=name, limit=limit, after_name=after_name, after_id=after_id)
 
 @app.get("/api/horses/{horse_id}", response_model=HorseDetailResponse)
-async def get_horse(horse_id: int, db: Session = Depends(get_db)):
+def get_horse(horse_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get detailed horse information"""
     horse = horse_service.get_horse_by_id(db, horse_id)
     if not horse:
         raise HTTPException(status_code=404, detail="Horse not found")
-    return horse
+    return _conditional(request, response, horse)
 
 @app.get("/api/horses/{horse_id}/stats", response_model=HorseStatsResponse)
-async def get_horse_stats(horse_id: int, db: Session = Depends(get_db)):
+def get_horse_stats(horse_id: int, db: Session = Depends(get_db)):
     """Get horse performance statistics"""
     return horse_service.get_horse_stats(db, horse_id)
 
 @app.get("/api/horses/{horse_id}/races", response_model=List[RaceResultResponse])
-async def get_horse_races(horse_id: int, limit: int = Query(20, le=50), db: Session = Depends(get_db)):
-    """Get horse's race history"""
-    return horse_service.get_horse_races(db, horse_id, limit)
+def get_horse_races(horse_id: int, request: Request, response: Response,
+                    limit: int = Query(20, le=50), db: Session = Depends(get_db)):
+    """Get horse's race history (msgpack with Accept: application/msgpack)"""
+    results = horse_service.get_horse_races(db, horse_id, limit)
+    if _wants_msgpack(request, response):
+        return _msgpack_response(results)
+    return results
 
 # Driver endpoints
 @app.get("/api/drivers", response_model=List[DriverResponse])
-async def get_drivers(
+def get_drivers(
     name: Optional[str] = Query(None, description="Search by driver name"),
     limit: int = Query(50, le=100),
+    after_name: Optional[str] = Query(None, description="Cursor: name of the last driver on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last driver on the previous page"),
     db: Session = Depends(get_db)
 ):
     """Get drivers with optional name search"""
-    return driver_service.get_drivers(db, name=name, limit=limit)
+    _check_cursor(after_name=after_name, after_id=after_id)
+    return driver_service.get_drivers(db, name=name, limit=limit, after_name=after_name, after_id=after_id)
 
 @app.get("/api/drivers/{driver_id}", response_model=DriverDetailResponse)
-async def get_driver(driver_id: int, db: Session = Depends(get_db)):
+def get_driver(driver_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get detailed driver information"""
     driver = driver_service.get_driver_by_id(db, driver_id)
     if not driver:
         raise HTTPException(status_code=404, detail="Driver not found")
-    return driver
+    return _conditional(request, response, driver)
 
 @app.get("/api/drivers/{driver_id}/stats", response_model=DriverStatsResponse)
-async def get_driver_stats(driver_id: int, db: Session = Depends(get_db)):
+def get_driver_stats(driver_id: int, db: Session = Depends(get_db)):
     """Get driver performance statistics"""
     return driver_service.get_driver_stats(db, driver_id)
 
 # Trainer endpoints
 @app.get("/api/trainers", response_model=List[TrainerResponse])
-async def get_trainers(
+def get_trainers(
     name: Optional[str] = Query(None, description="Search by trainer name"),
     limit: int = Query(50, le=100),
+    after_name: Optional[str] = Query(None, description="Cursor: name of the last trainer on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last trainer on the previous page"),
     db: Session = Depends(get_db)
 ):
     """Get trainers with optional name search"""
-    return trainer_service.get_trainers(db, name=name, limit=limit)
+    _check_cursor(after_name=after_name, after_id=after_id)
+    return trainer_service.get_trainers(db, name=name, limit=limit, after_name=after_name, after_id=after_id)
 
 @app.get("/api/trainers/{trainer_id}", response_model=TrainerDetailResponse)
-async def get_trainer(trainer_id: int, db: Session = Depends(get_db)):
+def get_trainer(trainer_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get detailed trainer information"""
     trainer = trainer_service.get_trainer_by_id(db, trainer_id)
     if not trainer:
         raise HTTPException(status_code=404, detail="Trainer not found")
-    return trainer
+    return _conditional(request, response, trainer)
 
 @app.get("/api/trainers/{trainer_id}/stats", response_model=TrainerStatsResponse)
-async def get_trainer_stats(trainer_id: int, db: Session = Depends(get_db)):
+def get_trainer_stats(trainer_id: int, db: Session = Depends(get_db)):
     """Get trainer performance statistics"""
     return trainer_service.get_trainer_stats(db, trainer_id)
 
 # Track endpoints
 @app.get("/api/tracks", response_model=List[TrackResponse])
-async def get_tracks(db: Session = Depends(get_db)):
+def get_tracks(db: Session = Depends(get_db)):
     """Get all tracks"""
     return race_service.get_tracks(db)
 
 @app.get("/api/tracks/{track_id}", response_model=TrackDetailResponse)
-async def get_track(track_id: int, db: Session = Depends(get_db)):
+def get_track(track_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get detailed track information"""
     track = race_service.get_track_by_id(db, track_id)
     if not track:
         raise HTTPException(status_code=404, detail="Track not found")
-    return track
+    return _conditional(request, response, track)
 
 # Analytics endpoints
 @app.get("/api/analytics/dashboard", response_model=DashboardResponse)
-async def get_dashboard_data(db: Session = Depends(get_db)):
+def get_dashboard_data(db: Session = Depends(get_db)):
     """Get dashboard analytics data"""
     return analytics_service.get_dashboard_data(db)
 
 @app.get("/api/analytics/top-performers", response_model=TopPerformersResponse)
-async def get_top_performers(
-    category: str = Query("horses", regex="^(horses|drivers|trainers)$"),
-    metric: str = Query("wins", regex="^(wins|earnings|win_rate)$"),
+def get_top_performers(
+    category: Literal["horses", "drivers", "trainers"] = Query("horses"),
+    metric: Literal["wins", "earnings", "win_rate"] = Query("wins"),
     limit: int = Query(10, le=50),
     db: Session = Depends(get_db)
 ):
@@ -189,8 +283,8 @@ async def get_top_performers(
     return analytics_service.get_top_performers(db, category, metric, limit)
 
 @app.get("/api/analytics/trends", response_model=TrendsResponse)
-async def get_trends(
-    period: str = Query("month", regex="^(week|month|quarter|year)$"),
+def get_trends(
+    period: Literal["week", "month", "quarter", "year"] = Query("month"),
     db: Session = Depends(get_db)
 ):
     """Get performance trends over time"""
@@ -208,7 +302,7 @@ async def fetch_latest_data(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Data fetch failed: {str(e)}")
 
 @app.get("/api/data/status")
-async def get_data_status(db: Session = Depends(get_db)):
+def get_data_status(db: Session = Depends(get_db)):
     """Get data freshness and status"""
     return data_fetcher.get_data_status(db)
 
@@ -243,13 +337,14 @@ async def get_future_races(days: int = 7):
     try:
         from services.ontario_racing_api import get_ontario_future_races
         races = await get_ontario_future_races(days)
-        return {
+        # orjson serializes the dataclasses and datetimes natively, skipping jsonable_encoder
+        return ORJSONResponse({
             "success": True,
             "races": races,
             "days_ahead": days,
             "total_races": len(races),
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": datetime.now()
+        })
     except Exception as e:
         logger.error(f"Error getting future races: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -260,13 +355,14 @@ async def get_today_races():
     try:
         from services.ontario_racing_api import get_ontario_races_today
         races = await get_ontario_races_today()
-        return {
+        # orjson serializes the dataclasses and datetimes natively, skipping jsonable_encoder
+        return ORJSONResponse({
             "success": True,
             "races": races,
             "date": date.today().isoformat(),
             "total_races": len(races),
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": datetime.now()
+        })
     except Exception as e:
         logger.error(f"Error getting today's races: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -279,17 +375,18 @@ async def get_race_results(track: str, race_date: str):
         from datetime import datetime
         
         # Parse date
-        parsed_date = datetime.strptime(race_date, "%Y-%m-%d").date()
+        parsed_date = date.fromisoformat(race_date)
         results = await get_ontario_race_results(track, parsed_date)
         
-        return {
+        # orjson serializes the dataclasses and datetimes natively, skipping jsonable_encoder
+        return ORJSONResponse({
             "success": True,
             "results": results,
             "track": track,
             "date": race_date,
             "total_results": len(results),
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": datetime.now()
+        })
     except Exception as e:
         logger.error(f"Error getting race results: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -436,8 +533,16 @@ async def get_racing_dates(track_code: str):
         logger.error(f"Error getting racing dates: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _database_record_counts(db: Session) -> dict:
+    """Row counts per table for the system status page, in one round trip"""
+    from models import Race, Horse, Driver, Trainer, Track
+    counts = db.query(
+        *(select(func.count(model.id)).scalar_subquery() for model in (Race, Horse, Driver, Trainer, Track))
+    ).one()
+    return dict(zip(("races", "horses", "drivers", "trainers", "tracks"), counts))
+
 @app.get("/api/system/status")
-async def get_system_status():
+async def get_system_status(db: Session = Depends(get_db)):
     """Get comprehensive system status showing all working features"""
     try:
         from services.ontario_racing_api import OntarioRacingDataService
@@ -447,16 +552,8 @@ async def get_system_status():
             real_tracks = await service.get_available_tracks()
         
         # Get sample data status
-        from database import get_db
-        db = next(get_db())
-        
-        # Count existing data
-        from models import Race, Horse, Driver, Trainer, Track
-        total_races = db.query(Race).count()
-        total_horses = db.query(Horse).count()
-        total_drivers = db.query(Driver).count()
-        total_trainers = db.query(Trainer).count()
-        total_tracks = db.query(Track).count()
+        # Count existing data on the threadpool; the queries would otherwise block the event loop
+        database_records = await run_in_threadpool(_database_record_counts, db)
         
         return {
             "system_status": "✅ OPERATIONAL",
@@ -481,13 +578,7 @@ async def get_system_status():
             
             "sample_data_system": {
                 "status": "✅ WORKING",
-                "database_records": {
-                    "races": total_races,
-                    "horses": total_horses,
-                    "drivers": total_drivers,
-                    "trainers": total_trainers,
-                    "tracks": total_tracks
-                }
+                "database_records": database_records
             },
             
             "api_endpoints": {
@@ -564,6 +655,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="auto",  # uvloop where it is installed (not on Windows), asyncio otherwise
+        http="httptools",
+        workers=int(os.getenv("WORKERS", 4)),
         log_level="info"
     )
\ No newline at end of file
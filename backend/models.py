@@ -1,8 +1,25 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Text, ForeignKey, Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Text, ForeignKey, Numeric, Index, MetaData, Table
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
+from typing import Optional
 from database import Base
 
+def finish_time_to_cs(finish_time: Optional[str]) -> Optional[int]:
+    """Centiseconds for an "M:SS.ff" finish time; None when missing or unparseable"""
+    if not finish_time:
+        return None
+    minutes, _, seconds = finish_time.strip().partition(':')
+    try:
+        return round((int(minutes) * 60 + float(seconds)) * 100)
+    except ValueError:
+        return None
+
+def format_finish_time(cs: Optional[int]) -> Optional[str]:
+    """Inverse of finish_time_to_cs"""
+    if cs is None:
+        return None
+    return f"{cs // 6000}:{(cs // 100) % 60:02d}.{cs % 100:02d}"
+
 class Track(Base):
     __tablename__ = "tracks"
     
@@ -62,6 +79,14 @@ class Trainer(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     race_entries = relationship("RaceEntry", back_populates="trainer")
+    
+    __table_args__ = (
+        # get_trainers lists active trainers by name; a partial index makes ORDER BY name LIMIT a range scan.
+        # The pg_trgm index for the ilike('%name%') search is created by migration (Postgres only).
+        Index('ix_trainers_active_name', 'name',
+              postgresql_where=active == True,
+              sqlite_where=active == True),
+    )
 
 class Race(Base):
     __tablename__ = "races"
@@ -84,6 +109,13 @@ class Race(Base):
     
     track = relationship("Track", back_populates="races")
     entries = relationship("RaceEntry", back_populates="race")
+    
+    __table_args__ = (
+        # Serves the (race_date, race_number, id) ordering and keyset cursors in RaceService
+        Index('ix_races_race_date_race_number', 'race_date', 'race_number', 'id'),
+        # /api/races?track_id=&date= filters on both columns together
+        Index('ix_races_track_id_race_date', 'track_id', 'race_date'),
+    )
 
 class RaceEntry(Base):
     __tablename__ = "race_entries"
@@ -99,6 +131,7 @@ class RaceEntry(Base):
     final_odds = Column(String(10))
     finish_position = Column(Integer)
     finish_time = Column(String(20))  # MM:SS.ff format
+    finish_time_cs = Column(Integer)  # finish_time in centiseconds, for MIN()/ORDER BY
     margin = Column(String(20))  # winning margin
     earnings = Column(Numeric(10, 2))
     scratched = Column(Boolean, default=False)
@@ -110,6 +143,40 @@ class RaceEntry(Base):
     horse = relationship("Horse", back_populates="race_entries")
     driver = relationship("Driver", back_populates="race_entries")
     trainer = relationship("Trainer", back_populates="race_entries")
+    
+    @validates('finish_time')
+    def _sync_finish_time_cs(self, key, value):
+        """Keep finish_time_cs in step with finish_time on ORM attribute sets.
+
+        Only fires for ORM attribute assignment: Core insert()/update(), bulk mappings and raw
+        SQL bypass it, so those paths must set finish_time_cs themselves via finish_time_to_cs.
+        """
+        self.finish_time_cs = finish_time_to_cs(value)
+        return value
+    
+    __table_args__ = (
+        # Trainer aggregates only read unscratched entries; on Postgres the INCLUDE columns
+        # let SUM(CASE ...) over finish_position/earnings run as an index-only scan
+        Index(
+            'ix_race_entries_trainer_active', 'trainer_id',
+            postgresql_include=['finish_position', 'earnings'],
+            postgresql_where=scratched == False,
+            sqlite_where=scratched == False
+        ),
+        # Same shape for driver stats and top-driver aggregates
+        Index(
+            'ix_race_entries_driver_active', 'driver_id',
+            postgresql_include=['finish_position', 'earnings'],
+            postgresql_where=scratched == False,
+            sqlite_where=scratched == False
+        ),
+        # Horse history/stats, and results ordered by finish for one race (also serves
+        # the race_id IN (...) lookup when race detail loads its entries)
+        Index('ix_race_entries_horse_id_race_id', 'horse_id', 'race_id'),
+        Index('ix_race_entries_race_id_finish_position', 'race_id', 'finish_position'),
+        # Best winning time per horse is a MIN() over this range
+        Index('ix_race_entries_horse_id_finish_time_cs', 'horse_id', 'finish_time_cs'),
+    )
 
 class BettingPool(Base):
     __tablename__ = "betting_pools"
@@ -135,4 +202,34 @@ class DataFetch(Base):
     records_processed = Column(Integer, default=0)
     error_message = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    completed_at = Column(DateTime(timezone=True))
\ No newline at end of file
+    completed_at = Column(DateTime(timezone=True))
+
+# Per-trainer aggregates over unscratched entries, maintained as a Postgres materialized
+# view by migration. Kept off Base.metadata so create_all and autogenerate leave it alone.
+trainer_stats_mv = Table(
+    "trainer_stats_mv", MetaData(),
+    Column("trainer_id", Integer, primary_key=True),
+    Column("total_starts", Integer),
+    Column("wins", Integer),
+    Column("places", Integer),
+    Column("shows", Integer),
+    Column("total_earnings", Numeric(12, 2))
+)
+
+# Starts/wins/earnings rollups behind the driver and horse top-performer rankings,
+# maintained the same way as trainer_stats_mv
+driver_stats_mv = Table(
+    "driver_stats_mv", MetaData(),
+    Column("driver_id", Integer, primary_key=True),
+    Column("total_starts", Integer),
+    Column("wins", Integer),
+    Column("total_earnings", Numeric(12, 2))
+)
+
+horse_stats_mv = Table(
+    "horse_stats_mv", MetaData(),
+    Column("horse_id", Integer, primary_key=True),
+    Column("total_starts", Integer),
+    Column("wins", Integer),
+    Column("total_earnings", Numeric(12, 2))
+)
@@ -1,7 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
-from decimal import Decimal
 
 class TrackResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -44,8 +43,8 @@ class HorseStatsResponse(BaseModel):
     win_percentage: float
     place_percentage: float
     show_percentage: float
-    total_earnings: Decimal
-    average_earnings: Decimal
+    total_earnings: float
+    average_earnings: float
     best_time: Optional[str] = None
     recent_form: List[str]  # Last 5 finishes
 
@@ -72,8 +71,8 @@ class DriverStatsResponse(BaseModel):
     win_percentage: float
     place_percentage: float
     show_percentage: float
-    total_earnings: Decimal
-    average_earnings: Decimal
+    total_earnings: float
+    average_earnings: float
 
 class TrainerResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -98,8 +97,8 @@ class TrainerStatsResponse(BaseModel):
     win_percentage: float
     place_percentage: float
     show_percentage: float
-    total_earnings: Decimal
-    average_earnings: Decimal
+    total_earnings: float
+    average_earnings: float
 
 class RaceEntryResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -112,7 +111,7 @@ class RaceEntryResponse(BaseModel):
     finish_position: Optional[int] = None
     finish_time: Optional[str] = None
     margin: Optional[str] = None
-    earnings: Optional[Decimal] = None
+    earnings: Optional[float] = None
     scratched: bool
     disqualified: bool
     horse: HorseResponse
@@ -127,7 +126,7 @@ class RaceResponse(BaseModel):
     race_date: date
     post_time: Optional[datetime] = None
     distance: Optional[int] = None
-    purse: Optional[Decimal] = None
+    purse: Optional[float] = None
     race_type: Optional[str] = None
     track_condition: Optional[str] = None
     status: str
@@ -152,7 +151,7 @@ class RaceResultResponse(BaseModel):
     finish_position: int
     finish_time: Optional[str] = None
     margin: Optional[str] = None
-    earnings: Optional[Decimal] = None
+    earnings: Optional[float] = None
     horse_name: str
     driver_name: str
     trainer_name: str
@@ -162,9 +161,9 @@ class BettingPoolResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     bet_type: str
-    pool_total: Optional[Decimal] = None
+    pool_total: Optional[float] = None
     winning_combination: Optional[str] = None
-    payout: Optional[Decimal] = None
+    payout: Optional[float] = None
 
 class DashboardResponse(BaseModel):
     total_races_today: int
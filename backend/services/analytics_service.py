@@ -1,35 +1,84 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, extract, case
-from typing import List, Dict, Any
+from sqlalchemy import and_, desc, func, extract, case, select
+from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta
-from models import Race, RaceEntry, Horse, Driver, Trainer, Track
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+import operator
+from models import Race, RaceEntry, Horse, Driver, Trainer, Track, horse_stats_mv
+from database import SessionLocal, estimated_count_expression, refresh_materialized_view, use_materialized_view
 from schemas import DashboardResponse, TopPerformersResponse, TrendsResponse
 from services.race_service import RaceService
 from services.horse_service import HorseService
 from services.driver_service import DriverService
 from services.trainer_service import TrainerService
 
+# Runs the independent dashboard queries side by side (6 per dashboard build), created on first use
+_DASHBOARD_WORKERS = 6
+_dashboard_pool: Optional[ThreadPoolExecutor] = None
+# Sync endpoints build the dashboard on threadpool threads, so two first requests can race here
+_dashboard_pool_lock = Lock()
+
+def _get_dashboard_pool() -> ThreadPoolExecutor:
+    global _dashboard_pool
+    pool = _dashboard_pool
+    if pool is None:
+        with _dashboard_pool_lock:
+            if _dashboard_pool is None:
+                _dashboard_pool = ThreadPoolExecutor(max_workers=_DASHBOARD_WORKERS, thread_name_prefix='dashboard')
+            pool = _dashboard_pool
+    return pool
+
+def close_dashboard_pool():
+    """Shut down the dashboard query pool (called on app shutdown)"""
+    global _dashboard_pool
+    with _dashboard_pool_lock:
+        pool, _dashboard_pool = _dashboard_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 class AnalyticsService:
+    # Dashboard and trend responses, shared by every instance; ingestion clears them
+    # through clear_cache when new races or results are stored
+    _cache: TTLCache = TTLCache(maxsize=8, ttl=60)
+    _cache_lock = Lock()
+    
     def __init__(self):
         self.race_service = RaceService()
         self.horse_service = HorseService()
         self.driver_service = DriverService()
         self.trainer_service = TrainerService()
     
+    @cachedmethod(operator.attrgetter('_cache'),
+                  key=lambda self, db: hashkey('dashboard'),
+                  lock=operator.attrgetter('_cache_lock'))
     def get_dashboard_data(self, db: Session) -> DashboardResponse:
-        # Get counts
-        total_races_today = self.race_service.get_today_race_count(db)
-        total_horses = self.horse_service.get_total_horses(db)
-        total_drivers = self.driver_service.get_total_drivers(db)
-        total_trainers = self.trainer_service.get_total_trainers(db)
+        queries = (
+            self._dashboard_counts,
+            lambda session: self.race_service.get_recent_races(session, limit=5),
+            lambda session: self.get_top_horses_by_wins(session, limit=5),
+            lambda session: self.driver_service.get_top_drivers_by_wins(session, limit=5),
+            lambda session: self.trainer_service.get_top_trainers_by_wins(session, limit=5),
+            self.trainer_service.get_total_trainers
+        )
         
-        # Get recent races
-        recent_races = self.race_service.get_recent_races(db, limit=5)
+        # The queries share nothing, so on a server database each runs on its own session and
+        # the dashboard waits for the slowest rather than the sum. SQLite serializes access to
+        # its file anyway, so there they stay on the request's session.
+        bind = db.get_bind()
+        if bind.dialect.name == "sqlite":
+            results = [query(db) for query in queries]
+        else:
+            def run(query):
+                with SessionLocal(bind=bind) as session:
+                    return query(session)
+            
+            results = list(_get_dashboard_pool().map(run, queries))
         
-        # Get top performers
-        top_horses = self.get_top_horses_by_wins(db, limit=5)
-        top_drivers = self.driver_service.get_top_drivers_by_wins(db, limit=5)
-        top_trainers = self.trainer_service.get_top_trainers_by_wins(db, limit=5)
+        counts, recent_races, top_horses, top_drivers, top_trainers, total_trainers = results
+        total_races_today, total_horses, total_drivers = counts
         
         return DashboardResponse(
             total_races_today=total_races_today,
@@ -42,6 +91,35 @@ class AnalyticsService:
             top_trainers=top_trainers
         )
     
+    def _dashboard_counts(self, db: Session):
+        """Today's races plus the horse and driver totals, in one round trip.
+
+        The totals cover the whole table, inactive rows included: the Postgres planner estimate
+        can't be filtered, so the exact fallback counts every row too and the tile means the same
+        on every backend.
+        """
+        races_today = select(func.count(Race.id)).where(Race.race_date == date.today()).scalar_subquery()
+        horses = select(func.count(Horse.id)).scalar_subquery()
+        drivers = select(func.count(Driver.id)).scalar_subquery()
+        return db.execute(select(
+            races_today,
+            estimated_count_expression(db, Horse.__tablename__, horses),
+            estimated_count_expression(db, Driver.__tablename__, drivers)
+        )).one()
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop cached dashboard and trend responses"""
+        with cls._cache_lock:
+            cls._cache.clear()
+    
+    @classmethod
+    def refresh_stats(cls, db: Session):
+        """Rebuild the horse and driver rollup views (when present) after an ingest, then drop cached responses"""
+        refresh_materialized_view(db, 'horse_stats_mv')
+        DriverService.refresh_stats(db)
+        cls.clear_cache()
+    
     def get_top_performers(self, db: Session, category: str, metric: str, limit: int = 10) -> TopPerformersResponse:
         performers = []
         
@@ -69,6 +147,9 @@ class AnalyticsService:
             performers=performers
         )
     
+    @cachedmethod(operator.attrgetter('_cache'),
+                  key=lambda self, db, period: hashkey('trends', period),
+                  lock=operator.attrgetter('_cache_lock'))
     def get_trends(self, db: Session, period: str) -> TrendsResponse:
         # Calculate date range based on period
         end_date = date.today()
@@ -106,59 +187,33 @@ class AnalyticsService:
         return TrendsResponse(period=period, data=data)
     
     def get_top_horses_by_wins(self, db: Session, limit: int = 10) -> List[Dict[str, Any]]:
-        results = db.query(
-            Horse.id,
-            Horse.name,
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).join(RaceEntry)\
-         .filter(Horse.active == True)\
-         .filter(RaceEntry.scratched == False)\
-         .group_by(Horse.id, Horse.name)\
-         .order_by(desc('wins'))\
-         .limit(limit).all()
-        
-        return [
-            {
-                'id': result.id,
-                'name': result.name,
-                'total_starts': result.total_starts,
-                'wins': result.wins,
-                'win_percentage': round((result.wins / result.total_starts * 100) if result.total_starts > 0 else 0, 2),
-                'total_earnings': float(result.total_earnings or 0)
-            }
-            for result in results
-        ]
+        query = self._horse_rollup(db)
+        return self._performer_rows(query.order_by(desc('wins')).limit(limit).all())
     
     def get_top_horses_by_earnings(self, db: Session, limit: int = 10) -> List[Dict[str, Any]]:
-        results = db.query(
-            Horse.id,
-            Horse.name,
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).join(RaceEntry)\
-         .filter(Horse.active == True)\
-         .filter(RaceEntry.scratched == False)\
-         .group_by(Horse.id, Horse.name)\
-         .order_by(desc('total_earnings'))\
-         .limit(limit).all()
-        
-        return [
-            {
-                'id': result.id,
-                'name': result.name,
-                'total_starts': result.total_starts,
-                'wins': result.wins,
-                'win_percentage': round((result.wins / result.total_starts * 100) if result.total_starts > 0 else 0, 2),
-                'total_earnings': float(result.total_earnings or 0)
-            }
-            for result in results
-        ]
+        query = self._horse_rollup(db)
+        return self._performer_rows(query.order_by(desc('total_earnings')).limit(limit).all())
     
     def get_top_horses_by_win_rate(self, db: Session, limit: int = 10, min_starts: int = 5) -> List[Dict[str, Any]]:
-        results = db.query(
+        if use_materialized_view(db, 'horse_stats_mv'):
+            mv = horse_stats_mv
+            query = self._horse_rollup(db)\
+                        .filter(mv.c.total_starts >= min_starts)\
+                        .order_by(desc(mv.c.wins * 1.0 / mv.c.total_starts))
+        else:
+            query = self._horse_rollup(db)\
+                        .having(func.count(RaceEntry.id) >= min_starts)\
+                        .order_by(desc(func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)) / func.count(RaceEntry.id)))
+        return self._performer_rows(query.limit(limit).all())
+    
+    def _horse_rollup(self, db: Session):
+        """Active horses with starts/wins/earnings, from horse_stats_mv when present"""
+        if use_materialized_view(db, 'horse_stats_mv'):
+            mv = horse_stats_mv
+            return db.query(Horse.id, Horse.name, mv.c.total_starts, mv.c.wins, mv.c.total_earnings)\
+                     .join(mv, mv.c.horse_id == Horse.id)\
+                     .filter(Horse.active == True)
+        return db.query(
             Horse.id,
             Horse.name,
             func.count(RaceEntry.id).label('total_starts'),
@@ -167,11 +222,10 @@ class AnalyticsService:
         ).join(RaceEntry)\
          .filter(Horse.active == True)\
          .filter(RaceEntry.scratched == False)\
-         .group_by(Horse.id, Horse.name)\
-         .having(func.count(RaceEntry.id) >= min_starts)\
-         .order_by(desc(func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)) / func.count(RaceEntry.id)))\
-         .limit(limit).all()
-        
+         .group_by(Horse.id, Horse.name)
+    
+    @staticmethod
+    def _performer_rows(results) -> List[Dict[str, Any]]:
         return [
             {
                 'id': result.id,
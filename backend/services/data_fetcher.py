@@ -1,20 +1,76 @@
 import httpx
 import asyncio
 import random
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, insert, func
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import os
 import logging
 from bs4 import BeautifulSoup
 import re
 import json
-from models import Track, Horse, Driver, Trainer, Race, RaceEntry, DataFetch
+from database import SessionLocal
+from models import Track, Horse, Driver, Trainer, Race, RaceEntry, DataFetch, finish_time_to_cs
 from schemas import DataStatusResponse
+from services.trainer_service import TrainerService
+from services.race_service import RaceService
+from services.analytics_service import AnalyticsService
 from services.ontario_racing_api import OntarioRacingDataService, get_ontario_races_today, get_ontario_future_races, get_live_ontario_odds, get_ontario_race_results, search_horse_stats, search_driver_stats, search_trainer_stats
 
 logger = logging.getLogger(__name__)
 
+# Sample data pools, shared by every sample generation call
+_SAMPLE_HORSES = (
+    "Lightning Strike", "Thunder Bay", "Maple Leaf", "Northern Star",
+    "Golden Arrow", "Silver Bullet", "Racing Thunder", "Swift Wind",
+    "Midnight Express", "Royal Flush", "Lucky Charm", "Fire Storm",
+    "Blazing Speed", "Storm Chaser", "Victory Lane", "Power Play"
+)
+_SAMPLE_ENTRY_HORSES = _SAMPLE_HORSES[:12]
+
+_SAMPLE_DRIVERS = (
+    "John MacDonald", "Trevor Henry", "Scott Coulter", "Doug McNair",
+    "James MacDonald", "Jody Jamieson", "Bob McClure", "Tyler Borth"
+)
+
+_SAMPLE_TRAINERS = (
+    "Ben Wallace", "Richard Moreau", "Carl Jamieson", "Robert McIntosh",
+    "Travis Cullen", "Jodie Cullen", "Mark Steacy", "Paul MacKenzie"
+)
+
+_TRACKS = (
+    "Woodbine Mohawk Park",
+    "Georgian Downs",
+    "Grand River Raceway",
+    "Hanover Raceway",
+    "Hiawatha Horse Park"
+)
+_SAMPLE_STORE_TRACKS = _TRACKS[:4]
+
+_TRAINER_LICENSE = "TRN{}".format
+_DRIVER_LICENSE = "ON{}".format
+
+_SEX = ('M', 'F', 'G')
+_COLORS = ('Bay', 'Brown', 'Chestnut', 'Black', 'Grey')
+_RACE_TYPES = ("Pace", "Trot")
+
+# Per-track sample seeding workers (forced to 1 on SQLite)
+_SEED_WORKERS = int(os.getenv("SAMPLE_SEED_WORKERS", "4"))
+
+# Rows per executemany batch when bulk inserting
+BULK_CHUNK = int(os.getenv("SAMPLE_BULK_CHUNK", "2000"))
+
+
+def _chunks(iterable, n):
+    """Yield successive lists of at most n items"""
+    it = iter(iterable)
+    while batch := list(islice(it, n)):
+        yield batch
+
 class DataFetcher:
     def __init__(self):
         self.base_urls = {
@@ -38,8 +94,9 @@ class DataFetcher:
         }
         
         try:
-            # Initialize tracks if not exists
-            await self._initialize_tracks(db)
+            # Initialize tracks if not exists. Database steps run on a worker thread so the
+            # event loop keeps serving other requests while they block.
+            await asyncio.to_thread(self._initialize_tracks, db)
             results['tracks_updated'] = 1
             
             # Try to fetch real data first
@@ -48,20 +105,20 @@ class DataFetcher:
             # If real data fetch fails or returns minimal data, use sample data as fallback
             if not real_data_success or results['races_updated'] < 5:
                 logger.info("Real data fetch unsuccessful, falling back to sample data")
-                await self._fetch_sample_data(db, results)
+                await asyncio.to_thread(self._fetch_sample_data, db, results)
             
             # Record successful fetch
-            self._record_fetch(db, 'all_sources', 'complete', 'success', 
-                             results['races_updated'] + results['entries_updated'])
+            await asyncio.to_thread(self._record_fetch, db, 'all_sources', 'complete', 'success',
+                                    results['races_updated'] + results['entries_updated'])
             
         except Exception as e:
             logger.error(f"Data fetch failed: {str(e)}")
             results['errors'].append(str(e))
-            self._record_fetch(db, 'all_sources', 'complete', 'failed', 0, str(e))
+            await asyncio.to_thread(self._record_fetch, db, 'all_sources', 'complete', 'failed', 0, str(e))
         
         return results
     
-    async def _initialize_tracks(self, db: Session):
+    def _initialize_tracks(self, db: Session):
         """Initialize Ontario harness racing tracks"""
         tracks_data = [
             {
@@ -103,8 +160,9 @@ class DataFetcher:
                 db.add(track)
         
         db.commit()
+        RaceService.clear_tracks_cache()
     
-    async def _fetch_sample_data(self, db: Session, results: Dict[str, Any]):
+    def _fetch_sample_data(self, db: Session, results: Dict[str, Any]):
         """Generate sample data for demonstration purposes"""
         
         # Sample horses
@@ -182,9 +240,9 @@ class DataFetcher:
         db.commit()
         
         # Create sample races and entries
-        await self._create_sample_races(db, results)
+        self._create_sample_races(db, results)
     
-    async def _create_sample_races(self, db: Session, results: Dict[str, Any]):
+    def _create_sample_races(self, db: Session, results: Dict[str, Any]):
         """Create sample races with entries"""
         
         # Get tracks, horses, drivers, trainers
@@ -268,6 +326,8 @@ class DataFetcher:
                         results['races_updated'] += 1
         
         db.commit()
+        TrainerService.refresh_stats(db)
+        AnalyticsService.refresh_stats(db)
     
     def _record_fetch(self, db: Session, source: str, fetch_type: str, status: str, 
                      records_processed: int, error_message: str = None):
@@ -294,10 +354,10 @@ class DataFetcher:
                        .first()
         
         # Get counts
-        total_races = db.query(Race).count()
-        total_horses = db.query(Horse).filter(Horse.active == True).count()
-        total_drivers = db.query(Driver).filter(Driver.active == True).count()
-        total_trainers = db.query(Trainer).filter(Trainer.active == True).count()
+        total_races = db.query(func.count(Race.id)).scalar()
+        total_horses = db.query(func.count(Horse.id)).filter(Horse.active == True).scalar()
+        total_drivers = db.query(func.count(Driver.id)).filter(Driver.active == True).scalar()
+        total_trainers = db.query(func.count(Trainer.id)).filter(Trainer.active == True).scalar()
         
         # Determine data freshness
         data_freshness = "outdated"
@@ -335,7 +395,9 @@ class DataFetcher:
                 historical_races = real_data.get('future_races', [])
                 
                 # Create races from real data
-                races_created = await self._process_real_races(db, today_races + historical_races, results)
+                races_created = await asyncio.to_thread(
+                    self._process_real_races, db, today_races + historical_races, results
+                )
                 
                 if races_created > 0:
                     logger.info(f"Successfully created {races_created} races from real data")
@@ -414,12 +476,9 @@ class DataFetcher:
                     'errors': []
                 }
                 
-                # Initialize tracks
-                await self._initialize_tracks(db)
-                
-                # Process races
+                # Store on a worker thread; the inserts and commits would otherwise block the event loop
                 all_races = real_data.get('todays_races', []) + real_data.get('future_races', [])
-                races_created = await self._process_real_races(db, all_races, results)
+                await asyncio.to_thread(self._store_real_races, db, all_races, results)
                 
                 return {
                     'success': True,
@@ -439,7 +498,14 @@ class DataFetcher:
             # Fallback to sample data on error
             return await self.generate_and_store_sample_data(db)
     
-    async def _process_real_races(self, db: Session, race_results: List, results: Dict[str, Any]) -> int:
+    def _store_real_races(self, db: Session, races: List, results: Dict[str, Any]):
+        """Store fetched races with their tracks, then refresh the stats built from them"""
+        self._initialize_tracks(db)
+        self._process_real_races(db, races, results)
+        TrainerService.refresh_stats(db)
+        AnalyticsService.refresh_stats(db)
+    
+    def _process_real_races(self, db: Session, race_results: List, results: Dict[str, Any]) -> int:
         """Process real race results and create database entries"""
         races_created = 0
         
@@ -458,6 +524,7 @@ class DataFetcher:
                     )
                     db.add(track)
                     db.commit()
+                    RaceService.clear_tracks_cache()
                     results['tracks_updated'] += 1
                 
                 # Check if race already exists
@@ -487,7 +554,7 @@ class DataFetcher:
                     
                     # Process race entries if available
                     if race_result.entries:
-                        entries_created = await self._process_real_entries(db, race.id, race_result.entries, results)
+                        entries_created = self._process_real_entries(db, race.id, race_result.entries, results)
                         results['entries_updated'] += entries_created
         
         except Exception as e:
@@ -496,20 +563,21 @@ class DataFetcher:
         
         return races_created
     
-    async def _process_real_entries(self, db: Session, race_id: int, entries: List[Dict], results: Dict[str, Any]) -> int:
+    def _process_real_entries(self, db: Session, race_id: int, entries: List[Dict], results: Dict[str, Any]) -> int:
         """Process real race entries and create database entries"""
         entries_created = 0
+        trainer_ids = set()
         
         try:
             for entry_data in entries:
                 # Get or create horse
-                horse = await self._get_or_create_horse(db, entry_data.get('horse_name'), results)
+                horse = self._get_or_create_horse(db, entry_data.get('horse_name'), results)
                 
                 # Get or create driver
-                driver = await self._get_or_create_driver(db, entry_data.get('driver_name'), results)
+                driver = self._get_or_create_driver(db, entry_data.get('driver_name'), results)
                 
                 # Get or create trainer
-                trainer = await self._get_or_create_trainer(db, entry_data.get('trainer_name'), results)
+                trainer = self._get_or_create_trainer(db, entry_data.get('trainer_name'), results)
                 
                 if horse:
                     # Create race entry
@@ -526,8 +594,12 @@ class DataFetcher:
                     )
                     db.add(race_entry)
                     entries_created += 1
+                    if trainer:
+                        trainer_ids.add(trainer.id)
             
             db.commit()
+            for trainer_id in trainer_ids:
+                TrainerService.invalidate_trainer(trainer_id)
         
         except Exception as e:
             logger.error(f"Error processing real entries: {e}")
@@ -535,7 +607,7 @@ class DataFetcher:
         
         return entries_created
     
-    async def _get_or_create_horse(self, db: Session, horse_name: str, results: Dict[str, Any]) -> Optional[Horse]:
+    def _get_or_create_horse(self, db: Session, horse_name: str, results: Dict[str, Any]) -> Optional[Horse]:
         """Get existing horse or create new one"""
         if not horse_name:
             return None
@@ -558,7 +630,7 @@ class DataFetcher:
         
         return horse
     
-    async def _get_or_create_driver(self, db: Session, driver_name: str, results: Dict[str, Any]) -> Optional[Driver]:
+    def _get_or_create_driver(self, db: Session, driver_name: str, results: Dict[str, Any]) -> Optional[Driver]:
         """Get existing driver or create new one"""
         if not driver_name:
             return None
@@ -577,7 +649,7 @@ class DataFetcher:
         
         return driver
     
-    async def _get_or_create_trainer(self, db: Session, trainer_name: str, results: Dict[str, Any]) -> Optional[Trainer]:
+    def _get_or_create_trainer(self, db: Session, trainer_name: str, results: Dict[str, Any]) -> Optional[Trainer]:
         """Get existing trainer or create new one"""
         if not trainer_name:
             return None
@@ -651,18 +723,9 @@ class DataFetcher:
         """Generate sample harness racing data as fallback"""
         logger.info("Generating sample Ontario harness racing data...")
         
-        # Sample tracks in Ontario
-        tracks = [
-            "Woodbine Mohawk Park",
-            "Georgian Downs", 
-            "Grand River Raceway",
-            "Hanover Raceway",
-            "Hiawatha Horse Park"
-        ]
-        
         # Sample race data
         races = []
-        for track in tracks:
+        for track in _TRACKS:
             for race_num in range(1, random.randint(8, 12)):  # 8-12 races per track
                 race = {
                     'track': track,
@@ -671,7 +734,7 @@ class DataFetcher:
                     'post_time': f"{6 + race_num}:00 PM",
                     'distance': "1 Mile",
                     'surface': "Fast",
-                    'race_type': random.choice(["Pace", "Trot"]),
+                    'race_type': random.choice(_RACE_TYPES),
                     'purse': random.randint(8000, 25000),
                     'conditions': "Open Handicap",
                     'entries': self._generate_sample_entries(8)
@@ -691,33 +754,17 @@ class DataFetcher:
     
     def _generate_sample_entries(self, count: int) -> List[Dict]:
         """Generate sample race entries"""
-        sample_horses = [
-            "Lightning Strike", "Thunder Bay", "Maple Leaf", "Northern Star",
-            "Golden Arrow", "Silver Bullet", "Racing Thunder", "Swift Wind",
-            "Midnight Express", "Royal Flush", "Lucky Charm", "Fire Storm"
-        ]
-        
-        sample_drivers = [
-            "John MacDonald", "Trevor Henry", "Scott Coulter", "Doug McNair",
-            "James MacDonald", "Jody Jamieson", "Bob McClure", "Tyler Borth"
-        ]
-        
-        sample_trainers = [
-            "Ben Wallace", "Richard Moreau", "Carl Jamieson", "Robert McIntosh",
-            "Travis Cullen", "Jodie Cullen", "Mark Steacy", "Paul MacKenzie"
-        ]
-        
         entries = []
         for i in range(count):
             entry = {
-                'horse_name': random.choice(sample_horses),
-                'driver': random.choice(sample_drivers),
-                'trainer': random.choice(sample_trainers),
+                'horse_name': random.choice(_SAMPLE_ENTRY_HORSES),
+                'driver': random.choice(_SAMPLE_DRIVERS),
+                'trainer': random.choice(_SAMPLE_TRAINERS),
                 'post_position': i + 1,
                 'program_number': str(i + 1),
                 'morning_line_odds': f"{random.randint(2, 12)}-1",
                 'age': random.randint(3, 8),
-                'sex': random.choice(['M', 'F', 'G']),
+                'sex': random.choice(_SEX),
                 'sire': "Unknown Sire",
                 'dam': "Unknown Dam",
                 'owner': f"Owner {i + 1}",
@@ -731,18 +778,132 @@ class DataFetcher:
         
         return entries
 
+    def _seed_track_races(self, bind, track_id: int, race_dates: List[date], today: date,
+                          horse_ids: List[int], driver_ids: List[int], trainer_ids: List[int]) -> Tuple[int, int]:
+        """Generate and commit one track's sample races and entries on a dedicated session"""
+        rng = np.random.default_rng()
+
+        # Plan the race card up front so entry values can be drawn in one batch
+        race_plan = []
+        for race_date in race_dates:
+            # Skip some days for some tracks
+            if rng.random() < 0.3:
+                continue
+
+            num_races = int(rng.integers(8, 13))
+            for race_num in range(1, num_races + 1):
+                race_plan.append((race_date, race_num, int(rng.integers(6, 11))))
+
+        if not race_plan:
+            return 0, 0
+
+        entry_counts = np.array([plan[2] for plan in race_plan], dtype=np.int64)
+        total_entries = int(entry_counts.sum())
+
+        morning_line_odds = np.char.mod('%.2f', rng.uniform(1.5, 15.0, total_entries)).tolist()
+        final_odds = np.char.mod('%.2f', rng.uniform(1.2, 20.0, total_entries)).tolist()
+        finish_positions = rng.integers(1, np.repeat(entry_counts, entry_counts) + 1).tolist()
+        finish_seconds = rng.integers(50, 60, total_entries).tolist()
+        finish_hundredths = rng.integers(10, 100, total_entries).tolist()
+        has_finish_time = (rng.random(total_entries) < 0.2).tolist()
+        earnings = rng.integers(0, 5001, total_entries).tolist()
+        scratched = (rng.random(total_entries) < 0.05).tolist()  # 5% scratch rate
+        driver_picks = rng.choice(driver_ids, total_entries).tolist()
+        trainer_picks = rng.choice(trainer_ids, total_entries).tolist()
+
+        # Races and entries go in as executemany batches rather than one ORM flush per row
+        race_rows = []
+        for race_date, race_num, num_entries in race_plan:
+            # Calculate race time with proper minute handling
+            base_hour = 18  # 6 PM
+            race_minutes = (race_num - 1) * 20  # 20 minutes between races
+            race_hour = base_hour + (race_minutes // 60)
+            race_minute = race_minutes % 60
+
+            post_time = datetime.combine(
+                race_date,
+                datetime.min.time().replace(hour=race_hour, minute=race_minute)
+            )
+
+            race_rows.append({
+                'track_id': track_id,
+                'race_date': race_date,
+                'race_number': race_num,
+                'post_time': post_time,
+                'distance': random.choice([1609, 1609, 1200, 1400]),  # Mostly 1 mile
+                'purse': random.randint(8000, 25000),
+                'race_type': random.choice(_RACE_TYPES),
+                'track_condition': random.choice(["Fast", "Good", "Sloppy"]),
+                'weather': random.choice(["Clear", "Cloudy", "Light Rain"]),
+                'status': 'finished' if race_date < today else 'scheduled'
+            })
+
+        db = SessionLocal(bind=bind)
+        try:
+            race_ids = db.scalars(
+                insert(Race).returning(Race.id, sort_by_parameter_order=True),
+                race_rows
+            ).all()
+
+            # Create race entries
+            entry_rows = []
+            k = 0
+            for race_id, (race_date, race_num, num_entries) in zip(race_ids, race_plan):
+                finished = race_date < today
+                selected_horses = random.sample(horse_ids, min(num_entries, len(horse_ids)))
+
+                for i, horse_id in enumerate(selected_horses):
+                    finish_time = f"1:{finish_seconds[k]}.{finish_hundredths[k]}" if finished and has_finish_time[k] else None
+                    entry_rows.append({
+                        'race_id': race_id,
+                        'horse_id': horse_id,
+                        'driver_id': driver_picks[k],
+                        'trainer_id': trainer_picks[k],
+                        'post_position': i + 1,
+                        'program_number': str(i + 1),
+                        'morning_line_odds': morning_line_odds[k],
+                        'final_odds': final_odds[k],
+                        'finish_position': finish_positions[k] if finished else None,
+                        'finish_time': finish_time,
+                        'finish_time_cs': finish_time_to_cs(finish_time),
+                        'earnings': earnings[k] if finished else 0.0,
+                        'scratched': scratched[k],
+                        'disqualified': False
+                    })
+                    k += 1
+
+            for batch in _chunks(entry_rows, BULK_CHUNK):
+                db.execute(insert(RaceEntry), batch)
+            db.commit()
+            return len(race_ids), len(entry_rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
     async def generate_and_store_sample_data(self, db: Session) -> Dict[str, Any]:
         """Generate and store sample data in database"""
+        # Seeding is all database work; run it on a worker thread so the event loop stays free
+        return await asyncio.to_thread(self._store_sample_data, db)
+    
+    def _clear_sample_tables(self, db: Session):
+        """Delete every race, entry, horse, driver and trainer and commit"""
+        db.execute(text("DELETE FROM race_entries"))
+        db.execute(text("DELETE FROM races"))
+        db.execute(text("DELETE FROM horses"))
+        db.execute(text("DELETE FROM drivers"))
+        db.execute(text("DELETE FROM trainers"))
+        db.commit()
+        # Raw SQL never reaches the session hooks that drop the cached trainer count
+        TrainerService.invalidate_total()
+
+    def _store_sample_data(self, db: Session) -> Dict[str, Any]:
         logger.info("Generating and storing sample data...")
         
         try:
             # Clear existing data
-            db.execute(text("DELETE FROM race_entries"))
-            db.execute(text("DELETE FROM races"))
-            db.execute(text("DELETE FROM horses"))
-            db.execute(text("DELETE FROM drivers"))
-            db.execute(text("DELETE FROM trainers"))
-            db.commit()
+            self._clear_sample_tables(db)
 
             stats = {
                 'races_created': 0,
@@ -752,36 +913,28 @@ class DataFetcher:
                 'entries_created': 0
             }
 
+            # Licence numbers are drawn without replacement so the unique constraint holds
+            trainer_licenses = map(_TRAINER_LICENSE, random.sample(range(1000, 10000), len(_SAMPLE_TRAINERS)))
+            driver_licenses = map(_DRIVER_LICENSE, random.sample(range(1000, 10000), len(_SAMPLE_DRIVERS)))
+
             # Create sample trainers
-            sample_trainers = [
-                "Ben Wallace", "Richard Moreau", "Carl Jamieson", "Robert McIntosh",
-                "Travis Cullen", "Jodie Cullen", "Mark Steacy", "Paul MacKenzie"
-            ]
-            
             trainers = {}
-            for trainer_name in sample_trainers:
+            for trainer_name, license_number in zip(_SAMPLE_TRAINERS, trainer_licenses):
                 trainer = Trainer(
                     name=trainer_name,
-                    license_number=f"TRN{random.randint(1000, 9999)}",
-                    stable_name=f"{trainer_name} Stable",
-                    phone=f"519-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                    email=f"{trainer_name.lower().replace(' ', '.')}@email.com"
+                    license_number=license_number,
+                    hometown="Ontario, Canada"
                 )
                 db.add(trainer)
                 trainers[trainer_name] = trainer
                 stats['trainers_created'] += 1
 
             # Create sample drivers
-            sample_drivers = [
-                "John MacDonald", "Trevor Henry", "Scott Coulter", "Doug McNair",
-                "James MacDonald", "Jody Jamieson", "Bob McClure", "Tyler Borth"
-            ]
-            
             drivers = {}
-            for driver_name in sample_drivers:
+            for driver_name, license_number in zip(_SAMPLE_DRIVERS, driver_licenses):
                 driver = Driver(
                     name=driver_name,
-                    license_number=f"ON{random.randint(1000, 9999)}",
+                    license_number=license_number,
                     birth_date=date(random.randint(1970, 1995), random.randint(1, 12), random.randint(1, 28)),
                     hometown="Ontario, Canada"
                 )
@@ -790,22 +943,14 @@ class DataFetcher:
                 stats['drivers_created'] += 1
 
             # Create sample horses
-            sample_horses = [
-                "Lightning Strike", "Thunder Bay", "Maple Leaf", "Northern Star",
-                "Golden Arrow", "Silver Bullet", "Racing Thunder", "Swift Wind",
-                "Midnight Express", "Royal Flush", "Lucky Charm", "Fire Storm",
-                "Blazing Speed", "Storm Chaser", "Victory Lane", "Power Play"
-            ]
-            
             horses = {}
-            for horse_name in sample_horses:
+            for horse_name in _SAMPLE_HORSES:
                 horse = Horse(
                     name=horse_name,
-                    age=random.randint(3, 8),
-                    sex=random.choice(['M', 'F', 'G']),
+                    sex=random.choice(_SEX),
                     sire="Unknown Sire",
                     dam="Unknown Dam", 
-                    color=random.choice(['Bay', 'Brown', 'Chestnut', 'Black', 'Grey']),
+                    color=random.choice(_COLORS),
                     foaling_date=date(2024 - random.randint(3, 8), random.randint(1, 12), random.randint(1, 28)),
                     owner=f"Owner {random.randint(1, 20)}",
                     breeder=f"Breeder {random.randint(1, 15)}"
@@ -814,82 +959,39 @@ class DataFetcher:
                 horses[horse_name] = horse
                 stats['horses_created'] += 1
 
-            db.flush()  # Ensure IDs are assigned
-
-            # Create sample races
-            tracks = [
-                "Woodbine Mohawk Park",
-                "Georgian Downs", 
-                "Grand River Raceway",
-                "Hanover Raceway"
-            ]
-
-            race_dates = [date.today() + timedelta(days=i) for i in range(-2, 5)]
-            
-            for track in tracks:
-                for race_date in race_dates:
-                    # Skip some days for some tracks
-                    if random.random() < 0.3:
-                        continue
-                        
-                    num_races = random.randint(8, 12)
-                    for race_num in range(1, num_races + 1):
-                        # Calculate race time with proper minute handling
-                        base_hour = 18  # 6 PM
-                        race_minutes = (race_num - 1) * 20  # 20 minutes between races
-                        race_hour = base_hour + (race_minutes // 60)
-                        race_minute = race_minutes % 60
-                        
-                        post_time = datetime.combine(
-                            race_date, 
-                            datetime.min.time().replace(hour=race_hour, minute=race_minute)
-                        )
-
-                        race = Race(
-                            track_name=track,
-                            race_date=race_date,
-                            race_number=race_num,
-                            post_time=post_time,
-                            distance=random.choice([1609, 1609, 1200, 1400]),  # Mostly 1 mile
-                            purse=random.randint(8000, 25000),
-                            race_type=random.choice(["Pace", "Trot"]),
-                            track_condition=random.choice(["Fast", "Good", "Sloppy"]),
-                            weather=random.choice(["Clear", "Cloudy", "Light Rain"])
-                        )
-                        db.add(race)
-                        stats['races_created'] += 1
+            # Commit the shared pools so per-track workers on other connections can see them
+            db.commit()
+            horse_ids = [horse.id for horse in horses.values()]
+            driver_ids = [driver.id for driver in drivers.values()]
+            trainer_ids = [trainer.id for trainer in trainers.values()]
 
-                        db.flush()  # Get race ID
+            self._initialize_tracks(db)
+            track_ids = {
+                track.name: track.id
+                for track in db.query(Track).filter(Track.name.in_(_SAMPLE_STORE_TRACKS))
+            }
 
-                        # Create race entries
-                        num_entries = random.randint(6, 10)
-                        selected_horses = random.sample(list(horses.keys()), min(num_entries, len(horses)))
-                        
-                        for i, horse_name in enumerate(selected_horses):
-                            horse = horses[horse_name]
-                            driver = random.choice(list(drivers.values()))
-                            trainer = random.choice(list(trainers.values()))
+            today = date.today()
+            race_dates = [today + timedelta(days=i) for i in range(-2, 5)]
 
-                            entry = RaceEntry(
-                                race_id=race.id,
-                                horse_id=horse.id,
-                                driver_id=driver.id,
-                                trainer_id=trainer.id,
-                                post_position=i + 1,
-                                program_number=str(i + 1),
-                                morning_line_odds=random.uniform(1.5, 15.0),
-                                actual_odds=random.uniform(1.2, 20.0),
-                                finish_position=random.randint(1, num_entries) if race_date < date.today() else None,
-                                win_time=f"1:{random.randint(50, 59)}.{random.randint(10, 99)}" if race_date < date.today() and random.random() < 0.2 else None,
-                                earnings=random.randint(0, 5000) if race_date < date.today() else 0.0,
-                                equipment_change="",
-                                scratched=random.random() < 0.05,  # 5% scratch rate
-                                late_change=""
-                            )
-                            db.add(entry)
-                            stats['entries_created'] += 1
+            # Tracks share no races or entries, so each one is seeded on its own session.
+            # SQLite only allows a single writer, so it stays on one worker there.
+            bind = db.get_bind()
+            workers = 1 if bind.dialect.name == "sqlite" else _SEED_WORKERS
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda track: self._seed_track_races(
+                        bind, track_ids[track], race_dates, today, horse_ids, driver_ids, trainer_ids
+                    ),
+                    _SAMPLE_STORE_TRACKS
+                )
+                for races_created, entries_created in results:
+                    stats['races_created'] += races_created
+                    stats['entries_created'] += entries_created
 
             db.commit()
+            TrainerService.refresh_stats(db)
+            AnalyticsService.refresh_stats(db)
             logger.info(f"Sample data created successfully: {stats}")
             
             return {
@@ -902,6 +1004,13 @@ class DataFetcher:
         except Exception as e:
             logger.error(f"Error generating sample data: {e}")
             db.rollback()
+            # The pools and each finished track were committed separately, so a rollback alone
+            # would leave a half-seeded database; clear it again instead
+            try:
+                self._clear_sample_tables(db)
+            except Exception as cleanup_error:
+                logger.error(f"Error clearing partial sample data: {cleanup_error}")
+                db.rollback()
             return {
                 'success': False,
                 'error': str(e),
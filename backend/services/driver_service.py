@@ -1,18 +1,26 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, case
+from sqlalchemy import and_, desc, func, case, or_, select, lambda_stmt, bindparam
 from typing import List, Optional
-from models import Driver, RaceEntry, Race, Track, Horse, Trainer
+from models import Driver, RaceEntry, Race, Track, Horse, Trainer, driver_stats_mv
 from schemas import DriverResponse, DriverDetailResponse, DriverStatsResponse
 from decimal import Decimal
+from database import refresh_materialized_view, strict_loading_options, use_materialized_view
+
+# List statements are built once at import; limit, name pattern and cursor are bound per call
+_DRIVERS_ALL = select(Driver).options(*strict_loading_options()).where(Driver.active == True).order_by(Driver.name, Driver.id).limit(bindparam('limit'))
+_DRIVERS_BY_NAME = _DRIVERS_ALL.where(Driver.name.ilike(bindparam('pattern')))
+# Keyset filter resuming after the last (name, id) of the previous page
+_DRIVERS_AFTER = or_(Driver.name > bindparam('after_name'),
+                and_(Driver.name == bindparam('after_name'), Driver.id > bindparam('after_id')))
 
 class DriverService:
-    def get_drivers(self, db: Session, name: Optional[str] = None, limit: int = 50) -> List[DriverResponse]:
-        query = db.query(Driver).filter(Driver.active == True)
-        
-        if name:
-            query = query.filter(Driver.name.ilike(f"%{name}%"))
-            
-        drivers = query.order_by(Driver.name).limit(limit).all()
+    def get_drivers(self, db: Session, name: Optional[str] = None, limit: int = 50,
+                    after_name: Optional[str] = None, after_id: Optional[int] = None) -> List[DriverResponse]:
+        stmt = _DRIVERS_BY_NAME if name else _DRIVERS_ALL
+        if after_name is not None and after_id is not None:
+            stmt = stmt.where(_DRIVERS_AFTER)
+        drivers = db.scalars(stmt, {'limit': limit, 'pattern': f"%{name}%",
+                                 'after_name': after_name, 'after_id': after_id}).all()
         return [DriverResponse.model_validate(driver) for driver in drivers]
     
     def get_driver_by_id(self, db: Session, driver_id: int) -> Optional[DriverDetailResponse]:
@@ -23,21 +31,17 @@ class DriverService:
     
     def get_driver_stats(self, db: Session, driver_id: int) -> DriverStatsResponse:
         # Get basic stats
-        stats = db.query(
+        # lambda_stmt caches the compiled SELECT; driver_id is extracted as a bound parameter
+        stmt = lambda_stmt(lambda: select(
             func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(case((RaceEntry.finish_position == 2, 1), else_=0)).label('places'),
-            func.sum(case((RaceEntry.finish_position == 3, 1), else_=0)).label('shows'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).filter(RaceEntry.driver_id == driver_id)\
-         .filter(RaceEntry.scratched == False)\
-         .first()
-        
-        total_starts = stats.total_starts or 0
-        wins = stats.wins or 0
-        places = stats.places or 0
-        shows = stats.shows or 0
-        total_earnings = stats.total_earnings or Decimal('0.00')
+            func.coalesce(func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)), 0).label('wins'),
+            func.coalesce(func.sum(case((RaceEntry.finish_position == 2, 1), else_=0)), 0).label('places'),
+            func.coalesce(func.sum(case((RaceEntry.finish_position == 3, 1), else_=0)), 0).label('shows'),
+            func.coalesce(func.sum(RaceEntry.earnings), 0).label('total_earnings')
+        ).where(RaceEntry.driver_id == driver_id)
+         .where(RaceEntry.scratched == False))
+        # An aggregate without GROUP BY always yields exactly one row; the sums are zeroed in SQL
+        total_starts, wins, places, shows, total_earnings = db.execute(stmt).one()
         
         # Calculate percentages
         win_percentage = (wins / total_starts * 100) if total_starts > 0 else 0
@@ -59,47 +63,33 @@ class DriverService:
         )
     
     def get_total_drivers(self, db: Session) -> int:
-        return db.query(Driver).filter(Driver.active == True).count()
+        return db.query(func.count(Driver.id)).filter(Driver.active == True).scalar()
     
     def get_top_drivers_by_wins(self, db: Session, limit: int = 10) -> List[dict]:
-        results = db.query(
-            Driver.id,
-            Driver.name,
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).join(RaceEntry)\
-         .filter(Driver.active == True)\
-         .filter(RaceEntry.scratched == False)\
-         .group_by(Driver.id, Driver.name)\
-         .order_by(desc('wins'))\
-         .limit(limit).all()
-        
-        return [
-            {
-                'id': result.id,
-                'name': result.name,
-                'total_starts': result.total_starts,
-                'wins': result.wins,
-                'win_percentage': round((result.wins / result.total_starts * 100) if result.total_starts > 0 else 0, 2),
-                'total_earnings': float(result.total_earnings or 0)
-            }
-            for result in results
-        ]
+        return self._get_top_drivers(db, 'wins', limit)
     
     def get_top_drivers_by_earnings(self, db: Session, limit: int = 10) -> List[dict]:
-        results = db.query(
-            Driver.id,
-            Driver.name,
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).join(RaceEntry)\
-         .filter(Driver.active == True)\
-         .filter(RaceEntry.scratched == False)\
-         .group_by(Driver.id, Driver.name)\
-         .order_by(desc('total_earnings'))\
-         .limit(limit).all()
+        return self._get_top_drivers(db, 'total_earnings', limit)
+    
+    def _get_top_drivers(self, db: Session, order_by: str, limit: int) -> List[dict]:
+        if use_materialized_view(db, 'driver_stats_mv'):
+            mv = driver_stats_mv
+            query = db.query(Driver.id, Driver.name, mv.c.total_starts, mv.c.wins, mv.c.total_earnings)\
+                      .join(mv, mv.c.driver_id == Driver.id)\
+                      .filter(Driver.active == True)
+        else:
+            query = db.query(
+                Driver.id,
+                Driver.name,
+                func.count(RaceEntry.id).label('total_starts'),
+                func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
+                func.sum(RaceEntry.earnings).label('total_earnings')
+            ).join(RaceEntry)\
+             .filter(Driver.active == True)\
+             .filter(RaceEntry.scratched == False)\
+             .group_by(Driver.id, Driver.name)
+        
+        results = query.order_by(desc(order_by)).limit(limit).all()
         
         return [
             {
@@ -111,4 +101,9 @@ class DriverService:
                 'total_earnings': float(result.total_earnings or 0)
             }
             for result in results
-        ]
\ No newline at end of file
+        ]
+    
+    @classmethod
+    def refresh_stats(cls, db: Session):
+        """Rebuild driver_stats_mv (when present) after an ingest"""
+        refresh_materialized_view(db, 'driver_stats_mv')
\ No newline at end of file
@@ -1,18 +1,26 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, case
+from sqlalchemy import and_, desc, func, case, or_, select, lambda_stmt, bindparam
 from typing import List, Optional
-from models import Horse, RaceEntry, Race, Track, Driver, Trainer
+from models import Horse, RaceEntry, Race, Track, Driver, Trainer, format_finish_time
 from schemas import HorseResponse, HorseDetailResponse, HorseStatsResponse, RaceResultResponse
 from decimal import Decimal
+from database import strict_loading_options
+
+# List statements are built once at import; limit, name pattern and cursor are bound per call
+_HORSES_ALL = select(Horse).options(*strict_loading_options()).where(Horse.active == True).order_by(Horse.name, Horse.id).limit(bindparam('limit'))
+_HORSES_BY_NAME = _HORSES_ALL.where(Horse.name.ilike(bindparam('pattern')))
+# Keyset filter resuming after the last (name, id) of the previous page
+_HORSES_AFTER = or_(Horse.name > bindparam('after_name'),
+                and_(Horse.name == bindparam('after_name'), Horse.id > bindparam('after_id')))
 
 class HorseService:
-    def get_horses(self, db: Session, name: Optional[str] = None, limit: int = 50) -> List[HorseResponse]:
-        query = db.query(Horse).filter(Horse.active == True)
-        
-        if name:
-            query = query.filter(Horse.name.ilike(f"%{name}%"))
-            
-        horses = query.order_by(Horse.name).limit(limit).all()
+    def get_horses(self, db: Session, name: Optional[str] = None, limit: int = 50,
+                    after_name: Optional[str] = None, after_id: Optional[int] = None) -> List[HorseResponse]:
+        stmt = _HORSES_BY_NAME if name else _HORSES_ALL
+        if after_name is not None and after_id is not None:
+            stmt = stmt.where(_HORSES_AFTER)
+        horses = db.scalars(stmt, {'limit': limit, 'pattern': f"%{name}%",
+                                 'after_name': after_name, 'after_id': after_id}).all()
         return [HorseResponse.model_validate(horse) for horse in horses]
     
     def get_horse_by_id(self, db: Session, horse_id: int) -> Optional[HorseDetailResponse]:
@@ -23,21 +31,17 @@ class HorseService:
     
     def get_horse_stats(self, db: Session, horse_id: int) -> HorseStatsResponse:
         # Get basic stats
-        stats = db.query(
+        # lambda_stmt caches the compiled SELECT; horse_id is extracted as a bound parameter
+        stmt = lambda_stmt(lambda: select(
             func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(case((RaceEntry.finish_position == 2, 1), else_=0)).label('places'),
-            func.sum(case((RaceEntry.finish_position == 3, 1), else_=0)).label('shows'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).filter(RaceEntry.horse_id == horse_id)\
-         .filter(RaceEntry.scratched == False)\
-         .first()
-        
-        total_starts = stats.total_starts or 0
-        wins = stats.wins or 0
-        places = stats.places or 0
-        shows = stats.shows or 0
-        total_earnings = stats.total_earnings or Decimal('0.00')
+            func.coalesce(func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)), 0).label('wins'),
+            func.coalesce(func.sum(case((RaceEntry.finish_position == 2, 1), else_=0)), 0).label('places'),
+            func.coalesce(func.sum(case((RaceEntry.finish_position == 3, 1), else_=0)), 0).label('shows'),
+            func.coalesce(func.sum(RaceEntry.earnings), 0).label('total_earnings')
+        ).where(RaceEntry.horse_id == horse_id)
+         .where(RaceEntry.scratched == False))
+        # An aggregate without GROUP BY always yields exactly one row; the sums are zeroed in SQL
+        total_starts, wins, places, shows, total_earnings = db.execute(stmt).one()
         
         # Calculate percentages
         win_percentage = (wins / total_starts * 100) if total_starts > 0 else 0
@@ -46,13 +50,12 @@ class HorseService:
         average_earnings = (total_earnings / total_starts) if total_starts > 0 else Decimal('0.00')
         
         # Get best time
-        best_time_result = db.query(RaceEntry.finish_time)\
-                            .filter(RaceEntry.horse_id == horse_id)\
-                            .filter(RaceEntry.finish_time.isnot(None))\
-                            .filter(RaceEntry.finish_position == 1)\
-                            .order_by(RaceEntry.finish_time)\
-                            .first()
-        best_time = best_time_result.finish_time if best_time_result else None
+        best_time = format_finish_time(
+            db.query(func.min(RaceEntry.finish_time_cs))
+              .filter(RaceEntry.horse_id == horse_id)
+              .filter(RaceEntry.finish_position == 1)
+              .scalar()
+        )
         
         # Get recent form (last 5 races)
         recent_races = db.query(RaceEntry.finish_position)\
@@ -80,6 +83,11 @@ class HorseService:
         )
     
     def get_horse_races(self, db: Session, horse_id: int, limit: int = 20) -> List[RaceResultResponse]:
+        horse_name = db.query(Horse.name).filter(Horse.id == horse_id).scalar()
+        if horse_name is None:
+            return []
+        
+        # Only Race and Track are joined; driver/trainer names are looked up once below
         results = db.query(
             RaceEntry.race_id,
             Race.race_number,
@@ -90,16 +98,28 @@ class HorseService:
             RaceEntry.finish_time,
             RaceEntry.margin,
             RaceEntry.earnings,
-            Horse.name.label('horse_name'),
-            Driver.name.label('driver_name'),
-            Trainer.name.label('trainer_name'),
+            RaceEntry.driver_id,
+            RaceEntry.trainer_id,
             RaceEntry.final_odds
-        ).join(Race).join(Track).join(Horse).join(Driver).join(Trainer)\
+        ).join(Race, RaceEntry.race_id == Race.id)\
+         .join(Track, Race.track_id == Track.id)\
          .filter(RaceEntry.horse_id == horse_id)\
          .filter(RaceEntry.scratched == False)\
+         .filter(RaceEntry.finish_position.isnot(None))\
          .order_by(desc(Race.race_date), desc(Race.race_number))\
          .limit(limit).all()
         
+        driver_names = dict(
+            db.query(Driver.id, Driver.name)
+              .filter(Driver.id.in_({result.driver_id for result in results}))
+              .all()
+        )
+        trainer_names = dict(
+            db.query(Trainer.id, Trainer.name)
+              .filter(Trainer.id.in_({result.trainer_id for result in results}))
+              .all()
+        )
+        
         return [RaceResultResponse(
             race_id=result.race_id,
             race_number=result.race_number,
@@ -110,11 +130,11 @@ class HorseService:
             finish_time=result.finish_time,
             margin=result.margin,
             earnings=result.earnings,
-            horse_name=result.horse_name,
-            driver_name=result.driver_name,
-            trainer_name=result.trainer_name,
+            horse_name=horse_name,
+            driver_name=driver_names[result.driver_id],
+            trainer_name=trainer_names[result.trainer_id],
             final_odds=result.final_odds
         ) for result in results]
     
     def get_total_horses(self, db: Session) -> int:
-        return db.query(Horse).filter(Horse.active == True).count()
\ No newline at end of file
+        return db.query(func.count(Horse.id)).filter(Horse.active == True).scalar()
\ No newline at end of file
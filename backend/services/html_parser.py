@@ -0,0 +1,13 @@
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+def make_soup(markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse markup with the C-backed lxml parser, falling back to html.parser if lxml is unavailable"""
+    try:
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    except FeatureNotFound:
+        logger.warning("lxml parser not available, falling back to html.parser")
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
@@ -2,17 +2,51 @@ import httpx
 import asyncio
 from bs4 import BeautifulSoup
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Awaitable, Callable
+from cachetools import LRUCache, TTLCache
 import logging
 import json
 import re
+import sys
+import soupsieve as sv
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import time
 from urllib.parse import urljoin, parse_qs, urlparse
+from services.html_parser import make_soup
+
+try:
+    # orjson parses straight from bytes in C; fall back to the stdlib if it isn't installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Patterns reused on every scrape. The card/result selectors are compiled once and
+# matched by soupsieve instead of running a class regex against every element.
+_SC_RACE_SEL = sv.compile(
+    'div[class*=race i], div[class*=entry i], div[class*=card i], '
+    'table[class*=race i], table[class*=entry i], table[class*=card i]'
+)
+_SC_RESULT_SEL = sv.compile(
+    'div[class*=result i], div[class*=race i], table[class*=result i], table[class*=race i]'
+)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Ontario tracks carried on the Standardbred Canada entries page
+_SC_ONTARIO_TRACKS = (
+    'Woodbine Mohawk Park',
+    'Georgian Downs',
+    'Grand River Raceway',
+    'Hanover Raceway',
+    'Hiawatha Horse Park'
+)
+
+# Standardbred Canada codes for Ontario tracks
+_ONTARIO_TRACK_CODES = frozenset({'GEODF', 'GRVRF', 'WBSBS', 'HNVR', 'SAR F', 'KD F', 'CLNTN', 'DRES'})
+
+@dataclass(slots=True, frozen=True)
 class RaceEntry:
     """Data structure for a race entry"""
     horse_name: str
@@ -34,7 +68,7 @@ class RaceEntry:
     last_race_date: Optional[date] = None
     last_race_finish: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Race:
     """Data structure for a race"""
     race_number: int
@@ -50,7 +84,7 @@ class Race:
     weather: str = ""
     track_condition: str = ""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RaceResult:
     """Data structure for race results"""
     race_number: int
@@ -62,7 +96,7 @@ class RaceResult:
     finishing_order: List[str]
     scratches: List[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HorseInfo:
     name: str
     registration_number: str
@@ -75,9 +109,23 @@ class HorseInfo:
 class OntarioRacingDataService:
     """Comprehensive Ontario harness racing data service"""
     
+    # Cache for avoiding repeated requests, shared by every instance.
+    # Entries are (data, timestamp) tuples so hot keys can be served stale while they refresh.
+    _cache: LRUCache = LRUCache(maxsize=512)
+    _cache_ttl = 300  # 5 minutes
+    # Parsed pages with their ETag/Last-Modified validators, for conditional re-fetches
+    _page_cache: LRUCache = LRUCache(maxsize=64)
+    # Parsed pages reused as-is for a short window, so the stats endpoints and the /racing
+    # callers within one request don't even pay for the revalidation round-trip
+    _dom_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+    # Fetches currently running, so concurrent callers for the same key share one request
+    _inflight: Dict[str, asyncio.Task] = {}
+    
     def __init__(self):
         self.client = httpx.AsyncClient(
-            timeout=30.0,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
             headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
@@ -89,59 +137,122 @@ class OntarioRacingDataService:
             'racing_api': 'https://theracingapi.com/v1'
         }
         
-        # Cache for avoiding repeated requests
-        self._cache = {}
-        self._cache_ttl = 300  # 5 minutes
+        # Worker threads for HTML parsing
+        self._parse_executor = ThreadPoolExecutor(max_workers=4)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        await self.close()
 
-    def _is_cache_valid(self, key: str) -> bool:
-        """Check if cached data is still valid"""
-        if key not in self._cache:
-            return False
-        return time.time() - self._cache[key]['timestamp'] < self._cache_ttl
-
-    def _get_from_cache(self, key: str) -> Any:
-        """Get data from cache"""
-        if self._is_cache_valid(key):
-            return self._cache[key]['data']
-        return None
-
-    def _set_cache(self, key: str, data: Any):
-        """Set data in cache"""
-        self._cache[key] = {
-            'data': data,
-            'timestamp': time.time()
-        }
+    async def close(self):
+        """Close the HTTP client and the parse pool"""
+        await self.client.aclose()
+        self._parse_executor.shutdown(wait=False)
+
+    async def _parse_html(self, content: bytes) -> BeautifulSoup:
+        """Build the soup on the parse pool so a large page doesn't stall the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_executor, make_soup, content)
+
+    async def _get_soup(self, url: str, params: Optional[Dict[str, Any]] = None) -> BeautifulSoup:
+        """Fetch a page and parse it off the event loop, revalidating any copy we already hold"""
+        key = str(httpx.URL(url, params=params))
+        soup = self._dom_cache.get(key)
+        if soup is not None:
+            return soup
+        
+        page = self._page_cache.get(key)
+        
+        headers = {}
+        if page is not None:
+            if page['etag']:
+                headers['If-None-Match'] = page['etag']
+            if page['last_modified']:
+                headers['If-Modified-Since'] = page['last_modified']
+        
+        response = await self.client.get(url, params=params, headers=headers)
+        if response.status_code == 304 and page is not None:
+            # Unchanged upstream: skip both the download and the parse
+            self._dom_cache[key] = page['soup']
+            return page['soup']
+        
+        soup = await self._parse_html(response.content)
+        
+        if response.status_code == 200:
+            self._dom_cache[key] = soup
+            etag = response.headers.get('etag')
+            last_modified = response.headers.get('last-modified')
+            if etag or last_modified:
+                self._page_cache[key] = {
+                    'soup': soup,
+                    'etag': etag,
+                    'last_modified': last_modified
+                }
+        return soup
+
+    async def _cached(self, key: str, factory: Callable[[], Awaitable[Any]],
+                      stale_while_revalidate: bool = False) -> Any:
+        """Return cached data for key, or run factory once and share its result with concurrent callers.
+
+        With stale_while_revalidate, data up to twice the TTL old is returned immediately
+        while a background refresh replaces it.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            data, timestamp = entry
+            age = time.monotonic() - timestamp
+            if age < self._cache_ttl:
+                return data
+            if stale_while_revalidate and age < 2 * self._cache_ttl:
+                if key not in self._inflight:
+                    self._start_fetch(key, factory)
+                return data
+        
+        task = self._inflight.get(key) or self._start_fetch(key, factory)
+        
+        # Shield so one caller being cancelled doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _start_fetch(self, key: str, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Launch the fetch for key and track it until it finishes"""
+        task = asyncio.ensure_future(self._fill_cache(key, factory))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._fetch_done(key, done))
+        return task
+
+    def _fetch_done(self, key: str, task: asyncio.Task):
+        """Drop a finished fetch and log any failure (a background refresh has no caller to raise to)"""
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error refreshing {key}: {task.exception()}")
+
+    async def _fill_cache(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory and cache a non-empty result"""
+        data = await factory()
+        if data:
+            self._cache[key] = (data, time.monotonic())
+        return data
 
     async def get_todays_races(self) -> List[Race]:
         """Get today's races from all Ontario tracks"""
-        cache_key = f"todays_races_{date.today()}"
-        cached = self._get_from_cache(cache_key)
-        if cached:
-            return cached
+        return await self._cached(
+            f"todays_races_{date.today()}", self._fetch_todays_races, stale_while_revalidate=True
+        )
 
-        races = []
-        
+    async def _fetch_todays_races(self) -> List[Race]:
+        """Scrape today's races from every source"""
         # Get races from multiple sources
         try:
-            # Primary source: Standardbred Canada
-            sc_races = await self._get_standardbred_canada_races(date.today())
-            races.extend(sc_races)
-            
-            # Secondary source: Woodbine Mohawk
-            woodbine_races = await self._get_woodbine_races(date.today())
-            races.extend(woodbine_races)
+            # Standardbred Canada and Woodbine Mohawk are scraped side by side
+            races = await self._collect_races([
+                self._get_standardbred_canada_races(date.today()),
+                self._get_woodbine_races(date.today())
+            ])
             
             # Remove duplicates based on track and race number
-            unique_races = self._deduplicate_races(races)
-            
-            self._set_cache(cache_key, unique_races)
-            return unique_races
+            return self._deduplicate_races(races)
             
         except Exception as e:
             logger.error(f"Error getting today's races: {e}")
@@ -151,15 +262,27 @@ class OntarioRacingDataService:
         """Get future races for the next N days"""
         all_races = []
         
-        for i in range(1, days_ahead + 1):
-            future_date = date.today() + timedelta(days=i)
-            races = await self._get_races_for_date(future_date)
+        future_dates = [date.today() + timedelta(days=i) for i in range(1, days_ahead + 1)]
+        results = await asyncio.gather(
+            *(self._get_races_for_date(future_date) for future_date in future_dates),
+            return_exceptions=True
+        )
+        for future_date, races in zip(future_dates, results):
+            if isinstance(races, Exception):
+                logger.error(f"Error getting races for {future_date}: {races}")
+                continue
             all_races.extend(races)
         
         return all_races
 
     async def get_live_odds(self, track: str = "woodbine") -> Dict[str, Any]:
         """Get live odds data"""
+        return await self._cached(
+            f"live_odds_{track}", lambda: self._fetch_live_odds(track), stale_while_revalidate=True
+        )
+
+    async def _fetch_live_odds(self, track: str) -> Dict[str, Any]:
+        """Fetch live odds from the API, falling back to scraping"""
         try:
             # Try The Odds API first (if API key available)
             odds_data = await self._get_odds_api_data()
@@ -175,15 +298,11 @@ class OntarioRacingDataService:
 
     async def get_race_results(self, track: str, race_date: date) -> List[RaceResult]:
         """Get race results for a specific track and date"""
-        cache_key = f"results_{track}_{race_date}"
-        cached = self._get_from_cache(cache_key)
-        if cached:
-            return cached
-
         try:
-            results = await self._get_standardbred_canada_results(track, race_date)
-            self._set_cache(cache_key, results)
-            return results
+            return await self._cached(
+                f"results_{track}_{race_date}",
+                lambda: self._get_standardbred_canada_results(track, race_date)
+            )
         except Exception as e:
             logger.error(f"Error getting race results: {e}")
             return []
@@ -191,7 +310,10 @@ class OntarioRacingDataService:
     async def get_horse_statistics(self, horse_name: str) -> Dict[str, Any]:
         """Get comprehensive horse statistics"""
         try:
-            return await self._get_standardbred_canada_horse_stats(horse_name)
+            return await self._cached(
+                f"horse_stats_{horse_name}",
+                lambda: self._get_standardbred_canada_horse_stats(horse_name)
+            )
         except Exception as e:
             logger.error(f"Error getting horse statistics: {e}")
             return {}
@@ -199,7 +321,10 @@ class OntarioRacingDataService:
     async def get_driver_statistics(self, driver_name: str) -> Dict[str, Any]:
         """Get driver performance statistics"""
         try:
-            return await self._get_standardbred_canada_driver_stats(driver_name)
+            return await self._cached(
+                f"driver_stats_{driver_name}",
+                lambda: self._get_standardbred_canada_driver_stats(driver_name)
+            )
         except Exception as e:
             logger.error(f"Error getting driver statistics: {e}")
             return {}
@@ -207,7 +332,10 @@ class OntarioRacingDataService:
     async def get_trainer_statistics(self, trainer_name: str) -> Dict[str, Any]:
         """Get trainer performance statistics"""
         try:
-            return await self._get_standardbred_canada_trainer_stats(trainer_name)
+            return await self._cached(
+                f"trainer_stats_{trainer_name}",
+                lambda: self._get_standardbred_canada_trainer_stats(trainer_name)
+            )
         except Exception as e:
             logger.error(f"Error getting trainer statistics: {e}")
             return {}
@@ -216,8 +344,7 @@ class OntarioRacingDataService:
         """Get list of available tracks from Standardbred Canada"""
         try:
             url = f"{self.base_urls['standardbred_canada']}/racing"
-            response = await self.client.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_soup(url)
             
             tracks = []
             
@@ -230,8 +357,7 @@ class OntarioRacingDataService:
                     text = option.get_text(strip=True)
                     
                     # Filter for Ontario tracks
-                    ontario_tracks = ['GEODF', 'GRVRF', 'WBSBS', 'HNVR', 'SAR F', 'KD F', 'CLNTN', 'DRES']
-                    if value in ontario_tracks:
+                    if value in _ONTARIO_TRACK_CODES:
                         tracks.append({
                             'code': value,
                             'name': text,
@@ -249,18 +375,9 @@ class OntarioRacingDataService:
         try:
             url = f"{self.base_urls['standardbred_canada']}/racing/racedates"
             response = await self.client.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for date information
-            dates = []
-            date_elements = soup.find_all(text=re.compile(r'\d{4}-\d{2}-\d{2}'))
-            
-            for date_text in date_elements:
-                date_match = re.search(r'\d{4}-\d{2}-\d{2}', date_text)
-                if date_match:
-                    dates.append(date_match.group())
             
-            return list(set(dates))  # Remove duplicates
+            # Dates are plain text, so scan the body directly rather than building and walking a tree
+            return list(set(_DATE_RE.findall(response.text)))  # Remove duplicates
             
         except Exception as e:
             logger.error(f"Error getting racing dates: {e}")
@@ -273,18 +390,17 @@ class OntarioRacingDataService:
         races = []
         
         try:
+            # Every track's entries are on the same /racing page, so fetch and parse it once
+            url = f"{self.base_urls['standardbred_canada']}/racing"
+            soup = await self._get_soup(url)
+            
+            # Look for race cards or entry tables. _parse_sc_race_element is still a placeholder
+            # that ignores the element, so every card would yield the same race: stop at the first.
+            race_elements = _SC_RACE_SEL.select(soup, limit=1)
+            
             # Get entries for Ontario tracks
-            ontario_tracks = [
-                'Woodbine Mohawk Park',
-                'Georgian Downs', 
-                'Grand River Raceway',
-                'Hanover Raceway',
-                'Hiawatha Horse Park'
-            ]
-            
-            for track in ontario_tracks:
-                track_races = await self._scrape_sc_track_entries(track, race_date)
-                races.extend(track_races)
+            for track in _SC_ONTARIO_TRACKS:
+                races.extend(self._extract_races_for_track(race_elements, track, race_date))
             
             return races
             
@@ -292,24 +408,11 @@ class OntarioRacingDataService:
             logger.error(f"Error scraping Standardbred Canada: {e}")
             return []
 
-    async def _scrape_sc_track_entries(self, track: str, race_date: date) -> List[Race]:
-        """Scrape entries for a specific track from Standardbred Canada"""
+    def _extract_races_for_track(self, race_elements, track: str, race_date: date) -> List[Race]:
+        """Build a track's races from the race elements of the shared Standardbred Canada page"""
         races = []
         
         try:
-            # Format date for URL
-            date_str = race_date.strftime("%Y-%m-%d")
-            
-            # Build URL - using the correct Standardbred Canada URL structure
-            url = f"{self.base_urls['standardbred_canada']}/racing"
-            
-            response = await self.client.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Parse the HTML to extract race data
-            # Look for race cards or entry tables
-            race_elements = soup.find_all(['div', 'table'], class_=re.compile(r'race|entry|card', re.I))
-            
             for race_elem in race_elements:
                 race = self._parse_sc_race_element(race_elem, track, race_date)
                 if race:
@@ -333,11 +436,11 @@ class OntarioRacingDataService:
             
             # Try to parse JSON first (if API available)
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 races = self._parse_woodbine_json(data, race_date)
-            except:
-                # Fallback to HTML parsing
-                soup = BeautifulSoup(response.text, 'html.parser')
+            except ValueError:
+                # Not JSON: fall back to HTML parsing
+                soup = await self._parse_html(response.content)
                 races = self._parse_woodbine_html(soup, race_date)
             
             return races
@@ -363,7 +466,7 @@ class OntarioRacingDataService:
             }
             
             response = await self.client.get(url, params=params)
-            return response.json()
+            return _json_loads(response.content)
             
         except Exception as e:
             logger.error(f"Error getting odds API data: {e}")
@@ -374,16 +477,11 @@ class OntarioRacingDataService:
         try:
             if track.lower() == "woodbine":
                 url = f"{self.base_urls['woodbine_mohawk']}/race/"
-                response = await self.client.get(url)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                await self._get_soup(url)
                 
-                # Parse odds from HTML
+                # Parse odds from HTML - placeholder implementation, nothing is extracted yet
+                # so don't walk the tree for the odds elements
                 odds_data = {}
-                odds_elements = soup.find_all('div', class_='odds')
-                
-                for elem in odds_elements:
-                    # Parse odds data - placeholder implementation
-                    pass
                 
                 return odds_data
             
@@ -406,11 +504,11 @@ class OntarioRacingDataService:
                 'active_tab': 'results'
             }
             
-            response = await self.client.get(url, params=params)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_soup(url, params=params)
             
-            # Parse results - look for results tables or cards
-            result_elements = soup.find_all(['div', 'table'], class_=re.compile(r'result|race', re.I))
+            # Parse results - look for results tables or cards (the first one only while
+            # _parse_sc_result_element returns placeholder values)
+            result_elements = _SC_RESULT_SEL.select(soup, limit=1)
             
             for result_elem in result_elements:
                 result = self._parse_sc_result_element(result_elem, track, race_date)
@@ -430,8 +528,7 @@ class OntarioRacingDataService:
             search_url = f"{self.base_urls['standardbred_canada']}/search"
             params = {'q': horse_name, 'type': 'horse'}
             
-            response = await self.client.get(search_url, params=params)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_soup(search_url, params=params)
             
             # Parse horse statistics
             stats = {
@@ -463,8 +560,7 @@ class OntarioRacingDataService:
             search_url = f"{self.base_urls['standardbred_canada']}/search"
             params = {'q': driver_name, 'type': 'driver'}
             
-            response = await self.client.get(search_url, params=params)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_soup(search_url, params=params)
             
             stats = {
                 'name': driver_name,
@@ -488,8 +584,7 @@ class OntarioRacingDataService:
             search_url = f"{self.base_urls['standardbred_canada']}/search"
             params = {'q': trainer_name, 'type': 'trainer'}
             
-            response = await self.client.get(search_url, params=params)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_soup(search_url, params=params)
             
             stats = {
                 'name': trainer_name,
@@ -509,36 +604,37 @@ class OntarioRacingDataService:
 
     async def _get_races_for_date(self, race_date: date) -> List[Race]:
         """Get races for a specific date"""
-        races = []
-        
         try:
             # Get from Standardbred Canada
-            sc_races = await self._get_standardbred_canada_races(race_date)
-            races.extend(sc_races)
+            sources = [self._get_standardbred_canada_races(race_date)]
             
             # Get from Woodbine if it's a racing day
             if race_date.weekday() in [0, 3, 4, 5]:  # Mon, Thu, Fri, Sat
-                woodbine_races = await self._get_woodbine_races(race_date)
-                races.extend(woodbine_races)
+                sources.append(self._get_woodbine_races(race_date))
             
+            races = await self._collect_races(sources)
             return self._deduplicate_races(races)
             
         except Exception as e:
             logger.error(f"Error getting races for {race_date}: {e}")
             return []
 
+    async def _collect_races(self, sources: List[Awaitable[List[Race]]]) -> List[Race]:
+        """Run race sources concurrently, keeping their races in source (priority) order"""
+        races = []
+        for result in await asyncio.gather(*sources, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error collecting races: {result}")
+            else:
+                races.extend(result)
+        return races
+
     def _deduplicate_races(self, races: List[Race]) -> List[Race]:
-        """Remove duplicate races based on track, date, and race number"""
-        seen = set()
-        unique_races = []
-        
+        """Remove duplicate races based on track, date, and race number (the first copy wins)"""
+        unique_races = {}
         for race in races:
-            key = (race.track, race.date, race.race_number)
-            if key not in seen:
-                seen.add(key)
-                unique_races.append(race)
-        
-        return unique_races
+            unique_races.setdefault((race.track, race.date, race.race_number), race)
+        return list(unique_races.values())
 
     def _parse_sc_race_element(self, elem, track: str, race_date: date) -> Optional[Race]:
         """Parse a race element from Standardbred Canada HTML"""
@@ -555,7 +651,7 @@ class OntarioRacingDataService:
             
             return Race(
                 race_number=race_number,
-                track=track,
+                track=sys.intern(track),  # Dedup keys then compare track names by identity
                 date=race_date,
                 post_time=post_time,
                 distance=distance,
@@ -602,8 +698,9 @@ class OntarioRacingDataService:
         races = []
         
         try:
-            # Parse HTML structure - placeholder implementation
-            race_elements = soup.find_all('div', class_='race')
+            # Parse HTML structure - placeholder implementation; every element maps to the
+            # same race, so only the first is looked up
+            race_elements = soup.find_all('div', class_='race', limit=1)
             
             for elem in race_elements:
                 # Extract race data from HTML
@@ -648,39 +745,47 @@ class OntarioRacingDataService:
             logger.error(f"Error parsing SC result element: {e}")
             return None
 
-# Convenience functions for easy integration
+# Convenience functions for easy integration, sharing one service (and its connection pool)
+
+_service: Optional[OntarioRacingDataService] = None
+
+def _get_service() -> OntarioRacingDataService:
+    global _service
+    if _service is None:
+        _service = OntarioRacingDataService()
+    return _service
+
+async def close_ontario_service():
+    """Close the shared service (called on app shutdown)"""
+    global _service
+    if _service is not None:
+        await _service.close()
+        _service = None
 
 async def get_ontario_races_today() -> List[Race]:
     """Get today's Ontario harness races"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_todays_races()
+    return await _get_service().get_todays_races()
 
 async def get_ontario_future_races(days: int = 7) -> List[Race]:
     """Get future Ontario harness races"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_future_races(days)
+    return await _get_service().get_future_races(days)
 
 async def get_live_ontario_odds() -> Dict[str, Any]:
     """Get live odds for Ontario tracks"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_live_odds()
+    return await _get_service().get_live_odds()
 
 async def get_ontario_race_results(track: str, date: date) -> List[RaceResult]:
     """Get race results for Ontario track"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_race_results(track, date)
+    return await _get_service().get_race_results(track, date)
 
 async def search_horse_stats(horse_name: str) -> Dict[str, Any]:
     """Search for horse statistics"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_horse_statistics(horse_name)
+    return await _get_service().get_horse_statistics(horse_name)
 
 async def search_driver_stats(driver_name: str) -> Dict[str, Any]:
     """Search for driver statistics"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_driver_statistics(driver_name)
+    return await _get_service().get_driver_statistics(driver_name)
 
 async def search_trainer_stats(trainer_name: str) -> Dict[str, Any]:
     """Search for trainer statistics"""
-    async with OntarioRacingDataService() as service:
-        return await service.get_trainer_statistics(trainer_name) 
\ No newline at end of file
+    return await _get_service().get_trainer_statistics(trainer_name) 
\ No newline at end of file
@@ -1,68 +1,112 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy import Float, and_, bindparam, cast, desc, func, or_, select
 from typing import List, Optional
 from datetime import date, datetime
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
+from threading import Lock
+import operator
 from models import Race, Track, RaceEntry, Horse, Driver, Trainer
+from database import strict_loading_options
 from schemas import RaceResponse, RaceDetailResponse, TrackResponse, TrackDetailResponse, RaceResultResponse
 
+# Finished entries with their race, track and connections; callers add the race filter and ordering
+_RACE_RESULTS = select(
+    RaceEntry.race_id,
+    Race.race_number,
+    Race.race_date,
+    Track.name.label('track_name'),
+    Race.distance,
+    RaceEntry.finish_position,
+    RaceEntry.finish_time,
+    RaceEntry.margin,
+    # Cast in SQL so model_construct gets the schema's float, not a Decimal
+    cast(RaceEntry.earnings, Float).label('earnings'),
+    Horse.name.label('horse_name'),
+    Driver.name.label('driver_name'),
+    Trainer.name.label('trainer_name'),
+    RaceEntry.final_odds
+).select_from(RaceEntry)\
+ .join(Race, RaceEntry.race_id == Race.id)\
+ .join(Track, Race.track_id == Track.id)\
+ .join(Horse, RaceEntry.horse_id == Horse.id)\
+ .join(Driver, RaceEntry.driver_id == Driver.id)\
+ .join(Trainer, RaceEntry.trainer_id == Trainer.id)\
+ .where(RaceEntry.finish_position.isnot(None))
+
+# Race detail, built once at import with race_id bound per call. Track joins on the single
+# race row; entries and their connections load in one IN query each.
+_RACE_DETAIL = select(Race)\
+    .options(
+        joinedload(Race.track),
+        selectinload(Race.entries).options(
+            selectinload(RaceEntry.horse),
+            selectinload(RaceEntry.driver),
+            selectinload(RaceEntry.trainer)
+        )
+    )\
+    .where(Race.id == bindparam('race_id'))
+
+def _after_cursor(after_date: date, after_race_number: int, after_id: int, number_desc: bool):
+    """Keyset filter resuming after the last (race_date, race_number, id) of the previous page.
+
+    Races are always newest date first; number_desc matches the race_number/id direction of the ordering.
+    """
+    if number_desc:
+        within_date = or_(Race.race_number < after_race_number,
+                          and_(Race.race_number == after_race_number, Race.id < after_id))
+    else:
+        within_date = or_(Race.race_number > after_race_number,
+                          and_(Race.race_number == after_race_number, Race.id > after_id))
+    return or_(Race.race_date < after_date, and_(Race.race_date == after_date, within_date))
+
 class RaceService:
-    def get_races(self, db: Session, date: Optional[date] = None, track_id: Optional[int] = None, limit: int = 50) -> List[RaceResponse]:
-        query = db.query(Race).join(Track)
+    # Active track list; tracks only change when ingestion adds one (see clear_tracks_cache)
+    _tracks_cache: TTLCache = TTLCache(maxsize=1, ttl=300)
+    _tracks_lock = Lock()
+    
+    def get_races(self, db: Session, date: Optional[date] = None, track_id: Optional[int] = None, limit: int = 50,
+                  after_date: Optional[date] = None, after_race_number: Optional[int] = None,
+                  after_id: Optional[int] = None) -> List[RaceResponse]:
+        # Populate race.track from the join instead of lazy-loading it per row
+        query = db.query(Race).join(Track).options(contains_eager(Race.track), *strict_loading_options())
         
         if date:
             query = query.filter(Race.race_date == date)
         if track_id:
             query = query.filter(Race.track_id == track_id)
+        if after_date is not None and after_race_number is not None and after_id is not None:
+            query = query.filter(_after_cursor(after_date, after_race_number, after_id, number_desc=False))
             
-        races = query.order_by(desc(Race.race_date), Race.race_number).limit(limit).all()
+        races = query.order_by(desc(Race.race_date), Race.race_number, Race.id).limit(limit).all()
         return [RaceResponse.model_validate(race) for race in races]
     
     def get_race_by_id(self, db: Session, race_id: int) -> Optional[RaceDetailResponse]:
-        race = db.query(Race).filter(Race.id == race_id).first()
+        race = db.execute(_RACE_DETAIL, {'race_id': race_id}).unique().scalar_one_or_none()
         if race:
             return RaceDetailResponse.model_validate(race)
         return None
     
     def get_race_results(self, db: Session, race_id: int) -> List[RaceResultResponse]:
-        results = db.query(
-            RaceEntry.race_id,
-            Race.race_number,
-            Race.race_date,
-            Track.name.label('track_name'),
-            Race.distance,
-            RaceEntry.finish_position,
-            RaceEntry.finish_time,
-            RaceEntry.margin,
-            RaceEntry.earnings,
-            Horse.name.label('horse_name'),
-            Driver.name.label('driver_name'),
-            Trainer.name.label('trainer_name'),
-            RaceEntry.final_odds
-        ).join(Race).join(Track).join(Horse).join(Driver).join(Trainer)\
-         .filter(RaceEntry.race_id == race_id)\
-         .filter(RaceEntry.finish_position.isnot(None))\
-         .order_by(RaceEntry.finish_position).all()
-        
-        return [RaceResultResponse(
-            race_id=result.race_id,
-            race_number=result.race_number,
-            race_date=result.race_date,
-            track_name=result.track_name,
-            distance=result.distance,
-            finish_position=result.finish_position,
-            finish_time=result.finish_time,
-            margin=result.margin,
-            earnings=result.earnings,
-            horse_name=result.horse_name,
-            driver_name=result.driver_name,
-            trainer_name=result.trainer_name,
-            final_odds=result.final_odds
-        ) for result in results]
+        stmt = _RACE_RESULTS.where(RaceEntry.race_id == race_id)\
+                            .order_by(RaceEntry.finish_position)
+        rows = db.execute(stmt).mappings().all()
+        # Columns already carry the schema's types, so skip re-validating each row
+        return [RaceResultResponse.model_construct(**row) for row in rows]
     
+    @cachedmethod(operator.attrgetter('_tracks_cache'),
+                  key=lambda self, db: hashkey('active'),
+                  lock=operator.attrgetter('_tracks_lock'))
     def get_tracks(self, db: Session) -> List[TrackResponse]:
         tracks = db.query(Track).filter(Track.active == True).all()
         return [TrackResponse.model_validate(track) for track in tracks]
     
+    @classmethod
+    def clear_tracks_cache(cls):
+        """Drop the cached active track list"""
+        with cls._tracks_lock:
+            cls._tracks_cache.clear()
+    
     def get_track_by_id(self, db: Session, track_id: int) -> Optional[TrackDetailResponse]:
         track = db.query(Track).filter(Track.id == track_id).first()
         if track:
@@ -70,11 +114,18 @@ class RaceService:
         return None
     
     def get_today_race_count(self, db: Session) -> int:
-        return db.query(Race).filter(Race.race_date == date.today()).count()
+        return db.query(func.count(Race.id)).filter(Race.race_date == date.today()).scalar()
     
-    def get_recent_races(self, db: Session, limit: int = 10) -> List[RaceResponse]:
-        races = db.query(Race).join(Track)\
-                  .filter(Race.status == 'finished')\
-                  .order_by(desc(Race.race_date), desc(Race.race_number))\
-                  .limit(limit).all()
+    def get_recent_races(self, db: Session, limit: int = 10,
+                         after_date: Optional[date] = None, after_race_number: Optional[int] = None,
+                         after_id: Optional[int] = None) -> List[RaceResponse]:
+        query = db.query(Race).join(Track)\
+                  .options(contains_eager(Race.track), *strict_loading_options())\
+                  .filter(Race.status == 'finished')
+        
+        if after_date is not None and after_race_number is not None and after_id is not None:
+            query = query.filter(_after_cursor(after_date, after_race_number, after_id, number_desc=True))
+        
+        races = query.order_by(desc(Race.race_date), desc(Race.race_number), desc(Race.id))\
+                     .limit(limit).all()
         return [RaceResponse.model_validate(race) for race in races]
\ No newline at end of file
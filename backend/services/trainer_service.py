@@ -1,105 +1,183 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, case
-from typing import List, Optional
-from models import Trainer, RaceEntry, Race, Track, Horse, Driver
+from sqlalchemy import and_, desc, func, case, event, or_, select
+from typing import Dict, List, Optional
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
+from threading import Lock
+from types import SimpleNamespace
+import operator
+from models import Trainer, RaceEntry, Race, Track, Horse, Driver, trainer_stats_mv
+from database import SessionLocal, refresh_materialized_view, strict_loading_options, use_materialized_view
 from schemas import TrainerResponse, TrainerDetailResponse, TrainerStatsResponse
 from decimal import Decimal
 
+# Per-trainer aggregates computed live from race_entries; trainer_stats_mv stores the same columns
+_TOTAL_STARTS = func.count(RaceEntry.id).label('total_starts')
+_WINS = func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins')
+_PLACES = func.sum(case((RaceEntry.finish_position == 2, 1), else_=0)).label('places')
+_SHOWS = func.sum(case((RaceEntry.finish_position == 3, 1), else_=0)).label('shows')
+_TOTAL_EARNINGS = func.sum(RaceEntry.earnings).label('total_earnings')
+
+def _win_percentage(wins, total_starts):
+    """Win percentage to two places, computed in SQL; 0 for trainers without starts"""
+    return func.coalesce(func.round(wins * 100.0 / func.nullif(total_starts, 0), 2), 0).label('win_percentage')
+
+def _use_stats_view(db: Session) -> bool:
+    return use_materialized_view(db, 'trainer_stats_mv')
+
+# Aggregate row for a trainer with no unscratched entries
+_NO_STARTS = SimpleNamespace(total_starts=0, wins=None, places=None, shows=None, total_earnings=None)
+
+def _stats_response(trainer_id: int, stats) -> TrainerStatsResponse:
+    """Build the stats response from a row of the starts/wins/places/shows/earnings aggregates"""
+    total_starts = stats.total_starts or 0
+    wins = stats.wins or 0
+    places = stats.places or 0
+    shows = stats.shows or 0
+    total_earnings = stats.total_earnings or Decimal('0.00')
+    
+    # Calculate percentages
+    win_percentage = (wins / total_starts * 100) if total_starts > 0 else 0
+    place_percentage = ((wins + places) / total_starts * 100) if total_starts > 0 else 0
+    show_percentage = ((wins + places + shows) / total_starts * 100) if total_starts > 0 else 0
+    average_earnings = (total_earnings / total_starts) if total_starts > 0 else Decimal('0.00')
+    
+    return TrainerStatsResponse(
+        trainer_id=trainer_id,
+        total_starts=total_starts,
+        wins=wins,
+        places=places,
+        shows=shows,
+        win_percentage=round(win_percentage, 2),
+        place_percentage=round(place_percentage, 2),
+        show_percentage=round(show_percentage, 2),
+        total_earnings=total_earnings,
+        average_earnings=average_earnings
+    )
+
 class TrainerService:
-    def get_trainers(self, db: Session, name: Optional[str] = None, limit: int = 50) -> List[TrainerResponse]:
-        query = db.query(Trainer).filter(Trainer.active == True)
+    # Computed stats per trainer, shared by every instance. Ingestion drops entries
+    # through invalidate_trainer/clear_stats_cache when new results land.
+    _stats_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+    _stats_lock = Lock()
+    # Active trainer count, dropped when an ORM commit touches a Trainer (see the session hooks
+    # below) or when raw SQL writes call invalidate_total
+    _total_cache: TTLCache = TTLCache(maxsize=1, ttl=300)
+    
+    def get_trainers(self, db: Session, name: Optional[str] = None, limit: int = 50,
+                     after_name: Optional[str] = None, after_id: Optional[int] = None) -> List[TrainerResponse]:
+        query = db.query(Trainer).options(*strict_loading_options()).filter(Trainer.active == True)
         
         if name:
             query = query.filter(Trainer.name.ilike(f"%{name}%"))
+        if after_name is not None and after_id is not None:
+            # Keyset filter resuming after the last (name, id) of the previous page
+            query = query.filter(or_(Trainer.name > after_name,
+                                     and_(Trainer.name == after_name, Trainer.id > after_id)))
             
-        trainers = query.order_by(Trainer.name).limit(limit).all()
+        trainers = query.order_by(Trainer.name, Trainer.id).limit(limit).all()
         return [TrainerResponse.model_validate(trainer) for trainer in trainers]
     
     def get_trainer_by_id(self, db: Session, trainer_id: int) -> Optional[TrainerDetailResponse]:
-        trainer = db.query(Trainer).filter(Trainer.id == trainer_id).first()
+        # TrainerDetailResponse has no nested relationships, so there is nothing to eager-load;
+        # strict loading keeps a future nested field from quietly lazy-loading race_entries
+        trainer = db.get(Trainer, trainer_id, options=strict_loading_options())
         if trainer:
             return TrainerDetailResponse.model_validate(trainer)
         return None
     
+    @cachedmethod(operator.attrgetter('_stats_cache'),
+                  key=lambda self, db, trainer_id: hashkey(trainer_id),
+                  lock=operator.attrgetter('_stats_lock'))
     def get_trainer_stats(self, db: Session, trainer_id: int) -> TrainerStatsResponse:
-        # Get basic stats
-        stats = db.query(
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(case((RaceEntry.finish_position == 2, 1), else_=0)).label('places'),
-            func.sum(case((RaceEntry.finish_position == 3, 1), else_=0)).label('shows'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).filter(RaceEntry.trainer_id == trainer_id)\
-         .filter(RaceEntry.scratched == False)\
-         .first()
+        # Get basic stats, from the materialized view when the database has one
+        if _use_stats_view(db):
+            stats = db.execute(
+                select(trainer_stats_mv).where(trainer_stats_mv.c.trainer_id == trainer_id)
+            ).first() or _NO_STARTS
+        else:
+            stats = db.query(_TOTAL_STARTS, _WINS, _PLACES, _SHOWS, _TOTAL_EARNINGS)\
+                      .filter(RaceEntry.trainer_id == trainer_id)\
+                      .filter(RaceEntry.scratched == False)\
+                      .first()
         
-        total_starts = stats.total_starts or 0
-        wins = stats.wins or 0
-        places = stats.places or 0
-        shows = stats.shows or 0
-        total_earnings = stats.total_earnings or Decimal('0.00')
+        return _stats_response(trainer_id, stats)
+    
+    def get_trainer_stats_bulk(self, db: Session, trainer_ids: List[int]) -> Dict[int, TrainerStatsResponse]:
+        """Stats for several trainers in one grouped query, keyed by trainer id"""
+        if not trainer_ids:
+            return {}
         
-        # Calculate percentages
-        win_percentage = (wins / total_starts * 100) if total_starts > 0 else 0
-        place_percentage = ((wins + places) / total_starts * 100) if total_starts > 0 else 0
-        show_percentage = ((wins + places + shows) / total_starts * 100) if total_starts > 0 else 0
-        average_earnings = (total_earnings / total_starts) if total_starts > 0 else Decimal('0.00')
+        if _use_stats_view(db):
+            rows = db.execute(
+                select(trainer_stats_mv).where(trainer_stats_mv.c.trainer_id.in_(trainer_ids))
+            ).all()
+        else:
+            rows = db.query(RaceEntry.trainer_id, _TOTAL_STARTS, _WINS, _PLACES, _SHOWS, _TOTAL_EARNINGS)\
+                     .filter(RaceEntry.trainer_id.in_(trainer_ids))\
+                     .filter(RaceEntry.scratched == False)\
+                     .group_by(RaceEntry.trainer_id)\
+                     .all()
+        by_trainer = {row.trainer_id: row for row in rows}
         
-        return TrainerStatsResponse(
-            trainer_id=trainer_id,
-            total_starts=total_starts,
-            wins=wins,
-            places=places,
-            shows=shows,
-            win_percentage=round(win_percentage, 2),
-            place_percentage=round(place_percentage, 2),
-            show_percentage=round(show_percentage, 2),
-            total_earnings=total_earnings,
-            average_earnings=average_earnings
-        )
+        # Trainers without starts get the same zeroed stats get_trainer_stats would return
+        return {
+            trainer_id: _stats_response(trainer_id, by_trainer.get(trainer_id, _NO_STARTS))
+            for trainer_id in trainer_ids
+        }
+    
+    @classmethod
+    def invalidate_trainer(cls, trainer_id: int):
+        """Drop a trainer's cached stats after new entries or results are stored for them"""
+        with cls._stats_lock:
+            cls._stats_cache.pop(hashkey(trainer_id), None)
+    
+    @classmethod
+    def clear_stats_cache(cls):
+        """Drop every cached trainer's stats, e.g. after a bulk reload"""
+        with cls._stats_lock:
+            cls._stats_cache.clear()
+    
+    @classmethod
+    def refresh_stats(cls, db: Session):
+        """Rebuild trainer_stats_mv (when present) after an ingest, then drop the cached stats"""
+        refresh_materialized_view(db, 'trainer_stats_mv')
+        cls.clear_stats_cache()
     
+    @cachedmethod(operator.attrgetter('_total_cache'),
+                  key=lambda self, db: hashkey('active'),
+                  lock=operator.attrgetter('_stats_lock'))
     def get_total_trainers(self, db: Session) -> int:
-        return db.query(Trainer).filter(Trainer.active == True).count()
+        return db.query(func.count(Trainer.id)).filter(Trainer.active == True).scalar()
+    
+    @classmethod
+    def invalidate_total(cls):
+        """Drop the cached active trainer count"""
+        with cls._stats_lock:
+            cls._total_cache.clear()
     
     def get_top_trainers_by_wins(self, db: Session, limit: int = 10) -> List[dict]:
-        results = db.query(
-            Trainer.id,
-            Trainer.name,
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).join(RaceEntry)\
-         .filter(Trainer.active == True)\
-         .filter(RaceEntry.scratched == False)\
-         .group_by(Trainer.id, Trainer.name)\
-         .order_by(desc('wins'))\
-         .limit(limit).all()
-        
-        return [
-            {
-                'id': result.id,
-                'name': result.name,
-                'total_starts': result.total_starts,
-                'wins': result.wins,
-                'win_percentage': round((result.wins / result.total_starts * 100) if result.total_starts > 0 else 0, 2),
-                'total_earnings': float(result.total_earnings or 0)
-            }
-            for result in results
-        ]
+        return self._get_top_trainers(db, 'wins', limit)
     
     def get_top_trainers_by_earnings(self, db: Session, limit: int = 10) -> List[dict]:
-        results = db.query(
-            Trainer.id,
-            Trainer.name,
-            func.count(RaceEntry.id).label('total_starts'),
-            func.sum(case((RaceEntry.finish_position == 1, 1), else_=0)).label('wins'),
-            func.sum(RaceEntry.earnings).label('total_earnings')
-        ).join(RaceEntry)\
-         .filter(Trainer.active == True)\
-         .filter(RaceEntry.scratched == False)\
-         .group_by(Trainer.id, Trainer.name)\
-         .order_by(desc('total_earnings'))\
-         .limit(limit).all()
+        return self._get_top_trainers(db, 'total_earnings', limit)
+    
+    def _get_top_trainers(self, db: Session, order_by: str, limit: int) -> List[dict]:
+        if _use_stats_view(db):
+            mv = trainer_stats_mv
+            query = db.query(Trainer.id, Trainer.name, mv.c.total_starts, mv.c.wins, mv.c.total_earnings,
+                             _win_percentage(mv.c.wins, mv.c.total_starts))\
+                      .join(mv, mv.c.trainer_id == Trainer.id)\
+                      .filter(Trainer.active == True)
+        else:
+            query = db.query(Trainer.id, Trainer.name, _TOTAL_STARTS, _WINS, _TOTAL_EARNINGS,
+                             _win_percentage(_WINS.element, _TOTAL_STARTS.element))\
+                      .join(RaceEntry)\
+                      .filter(Trainer.active == True)\
+                      .filter(RaceEntry.scratched == False)\
+                      .group_by(Trainer.id, Trainer.name)
+        
+        results = query.order_by(desc(order_by)).limit(limit).all()
         
         return [
             {
@@ -107,8 +185,26 @@ class TrainerService:
                 'name': result.name,
                 'total_starts': result.total_starts,
                 'wins': result.wins,
-                'win_percentage': round((result.wins / result.total_starts * 100) if result.total_starts > 0 else 0, 2),
+                'win_percentage': float(result.win_percentage),
                 'total_earnings': float(result.total_earnings or 0)
             }
             for result in results
-        ]
\ No newline at end of file
+        ]
+
+# ORM trainer inserts/updates/deletes on the app's sessions are noted at flush time but only
+# drop the cached count once they commit, so a concurrent request can't re-cache the pre-commit
+# value. Raw SQL and Core statements bypass these hooks; callers invalidate_total() themselves.
+@event.listens_for(SessionLocal, 'after_flush')
+def _note_trainer_changes(session, flush_context):
+    if any(isinstance(obj, Trainer) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info['trainers_changed'] = True
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _invalidate_trainer_total(session):
+    if session.info.pop('trainers_changed', False):
+        TrainerService.invalidate_total()
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _discard_trainer_changes(session):
+    session.info.pop('trainers_changed', None)
+
@@ -1,100 +1,392 @@
 import httpx
 import asyncio
 import time
-from typing import List, Dict, Optional, Any
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Any, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from datetime import datetime, date
 import logging
+import multiprocessing
+import os
 import re
 from urllib.parse import urljoin, urlparse
 import json
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from cachetools import TTLCache
+from services.html_parser import make_soup
+
+try:
+    # orjson parses straight from bytes in C; fall back to the stdlib if it isn't installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Patterns applied to every card, row and cell, compiled once at import
+_RACE_NUMBER_RE = re.compile(r'Race\s+(\d+)', re.I)
+_POST_TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(AM|PM)?', re.I)
+_WOODBINE_POST_TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(AM|PM)', re.I)
+_SCRIPT_KEYWORD_RE = re.compile(r'race|entry', re.I)
+_DATE_VALUE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Entry cell classifier: one match per cell, dispatched on the alternative that matched.
+# Alternatives are tried in order, so 1-2 digit numbers are positions and longer ones fall to age.
+_ENTRY_CELL_RE = re.compile(
+    r'(?P<position>\d{1,2})'
+    r'|(?P<odds>\d+-\d+)'
+    r'|(?P<age_sex>(?P<age>\d+)(?P<sex>[MFG]?))'
+    r'|(?P<name>[A-Za-z][A-Za-z\s]{2,})'
+)
+
+# Free-text scans of entry and odds blocks
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_ODDS_IN_TEXT_RE = re.compile(r'\b\d+-\d+\b')
+_ANY_ODDS_RE = re.compile(r'\b\d+[-/]\d+\b|\b\d+\.\d+\b')
+_CAPITALIZED_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+# CSS selectors, compiled once instead of on every select() call
+_WOODBINE_RACE_SEL = sv.compile('div[class*=race i], section[class*=race i]')
+_WOODBINE_ENTRY_SEL = sv.compile(
+    'tr[class*=entry i], tr[class*=horse i], div[class*=entry i], div[class*=horse i]'
+)
+_CARD_SEL = sv.compile(
+    'div[class*=race i], div[class*=entry i], div[class*=card i], '
+    'table[class*=race i], table[class*=entry i], table[class*=card i]'
+)
+_ENTRY_DIV_SEL = sv.compile('div[class*=entry i], div[class*=horse i]')
+_ODDS_SEL = sv.compile(
+    'table[class*=odd i], table[class*=bet i], table[class*=wager i], '
+    'div[class*=odd i], div[class*=bet i], div[class*=wager i]'
+)
+
+# Parsed Woodbine races by date: past cards don't change, today's and later expire after the TTL
+_WOODBINE_CACHE_TTL = 300  # 5 minutes
+_woodbine_race_cache: Dict[date, Tuple[float, List[Dict]]] = {}
+
+# Responses worth retrying: rate limited or a transient upstream failure
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Successful GETs are reused for a short while, so interleaved probes and user scrapes share a download
+_RESPONSE_CACHE_TTL = 120  # 2 minutes
+
+# Worker processes for CPU-bound page parsing, created on first use. This is per uvicorn
+# worker, so the default WORKERS=4 runs 4 x PARSE_WORKERS parser processes in total.
+_PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "2"))
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+# Forking a threaded server process can copy a lock (e.g. logging's) that another thread held,
+# deadlocking the child the first time the parser logs; start workers from a clean process
+_PARSE_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=_PARSE_WORKERS, mp_context=multiprocessing.get_context(_PARSE_START_METHOD)
+        )
+    return _parse_pool
+
+def _is_woodbine_node(name: str, attrs: Dict) -> bool:
+    """Keep only script tags and race containers (with their subtrees) when building a Woodbine soup"""
+    if name == 'script':
+        return True
+    return name in ('div', 'section') and 'race' in str(attrs.get('class', '')).lower()
+
+_WOODBINE_STRAINER = SoupStrainer(_is_woodbine_node)
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json_object(text: str) -> Optional[Any]:
+    """Pull the first JSON object embedded in a script body.
+
+    Most pages assign one object literal (``window.data = {...};``), so the span from the first
+    ``{`` to the last ``}`` is tried with orjson first. Otherwise raw_decode bracket-matches an
+    object at each ``{`` in turn instead of backtracking a greedy regex over the whole script.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    
+    end = text.rfind('}')
+    try:
+        return _json_loads(text[start:end + 1])
+    except ValueError:
+        pass
+    
+    while start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except ValueError:
+            start = text.find('{', start + 1)
+    return None
+
+def _parse_woodbine_html(body: bytes, race_date: date) -> List[Dict]:
+    """Parse a raw Woodbine page; module-level so it can run in the parse process pool"""
+    # Hand lxml the raw bytes; it sniffs the encoding itself instead of httpx decoding a str copy
+    return _parse_woodbine_page(make_soup(body, parse_only=_WOODBINE_STRAINER), race_date)
+
+def _find_races_list(data: Any, depth: int = 0) -> Optional[List]:
+    """Find the first 'races' list in a decoded JSON document (e.g. Next.js page props)"""
+    if depth > 6:
+        return None
+    if isinstance(data, dict):
+        races = data.get('races')
+        if isinstance(races, list):
+            return races
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+    for child in children:
+        if isinstance(child, (dict, list)):
+            races = _find_races_list(child, depth + 1)
+            if races is not None:
+                return races
+    return None
+
+def _races_from_ld_json(data: Any) -> List[Dict]:
+    """Map schema.org SportsEvent items from an ld+json block to race dicts"""
+    items = data if isinstance(data, list) else data.get('@graph', [data]) if isinstance(data, dict) else []
+    races = []
+    for item in items:
+        if not isinstance(item, dict) or item.get('@type') != 'SportsEvent':
+            continue
+        race_match = _RACE_NUMBER_RE.search(item.get('name', ''))
+        if race_match:
+            races.append({'race_number': int(race_match.group(1)), 'post_time': item.get('startDate', '')})
+    return races
+
+def _parse_woodbine_structured_data(soup: BeautifulSoup) -> List[Dict]:
+    """Races from the page's structured data (__NEXT_DATA__ or ld+json), if it carries any"""
+    # str() because orjson only accepts exact str, not bs4's NavigableString subclass
+    next_data = soup.find('script', id='__NEXT_DATA__')
+    if next_data is not None and next_data.string:
+        try:
+            races = _find_races_list(_json_loads(str(next_data.string)))
+            if races:
+                return races
+        except ValueError:
+            pass
+    
+    races = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        if script.string:
+            try:
+                races.extend(_races_from_ld_json(_json_loads(str(script.string))))
+            except ValueError:
+                continue
+    return races
+
+def _parse_woodbine_page(soup: BeautifulSoup, race_date: date) -> List[Dict]:
+    """Parse Woodbine page for race data"""
+    races = []
+    
+    try:
+        # Structured data, when present, is all we need: skip the script scan and the DOM walk
+        races = _parse_woodbine_structured_data(soup)
+        if races:
+            return races
+        
+        # Look for JSON data in script tags
+        script_tags = soup.find_all('script')
+        for script in script_tags:
+            body = script.string
+            # One case-insensitive scan for either keyword, without lowercasing a copy of the body twice
+            if body and _SCRIPT_KEYWORD_RE.search(body):
+                try:
+                    # Try to extract JSON data
+                    data = _extract_json_object(body)
+                    if isinstance(data, dict) and 'races' in data:
+                        races.extend(data['races'])
+                except (ValueError, TypeError):
+                    continue
+        
+        # If no JSON found, try HTML parsing
+        if not races:
+            race_elements = _WOODBINE_RACE_SEL.select(soup)
+            for elem in race_elements:
+                race_data = _parse_woodbine_race_element(elem)
+                if race_data:
+                    races.append(race_data)
+        
+    except Exception as e:
+        logger.error(f"Error parsing Woodbine page: {e}")
+    
+    return races
+
+def _parse_woodbine_race_element(element) -> Optional[Dict]:
+    """Parse a race element from Woodbine"""
+    try:
+        race = {}
+        
+        # Extract race number and post time in a single walk over the element's text
+        for text in element.stripped_strings:
+            if 'race_number' not in race:
+                race_match = _RACE_NUMBER_RE.search(text)
+                if race_match:
+                    race['race_number'] = int(race_match.group(1))
+            
+            if 'post_time' not in race and _WOODBINE_POST_TIME_RE.search(text):
+                race['post_time'] = text
+            
+            if 'race_number' in race and 'post_time' in race:
+                break
+        
+        # Extract entries
+        entries = []
+        entry_elements = _WOODBINE_ENTRY_SEL.select(element)
+        
+        for entry_elem in entry_elements:
+            entry_data = _parse_woodbine_entry(entry_elem)
+            if entry_data:
+                entries.append(entry_data)
+        
+        if entries:
+            race['entries'] = entries
+        
+        return race if 'race_number' in race else None
+        
+    except Exception as e:
+        logger.error(f"Error parsing Woodbine race element: {e}")
+        return None
+
+def _parse_woodbine_entry(element) -> Optional[Dict]:
+    """Parse an entry element from Woodbine"""
+    try:
+        entry = {}
+        
+        # Similar parsing logic as Standardbred Canada
+        # This would need to be customized based on Woodbine's actual HTML structure.
+        
+        return entry if entry else None
+        
+    except Exception as e:
+        logger.error(f"Error parsing Woodbine entry: {e}")
+        return None
+
 class RacingWebScraper:
     """Specialized web scraper for Ontario harness racing data"""
     
     def __init__(self):
+        # HTTP/2 multiplexes the concurrent Woodbine fetches over one connection per host
         self.client = httpx.AsyncClient(
-            timeout=30.0,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0),
             headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
                 'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1'
             }
         )
-        self.rate_limit_delay = 2.0  # 2 seconds between requests
-        self.last_request_time = 0
+        self.rate_limit_delay = 2.0  # 2 seconds between requests to the same host
+        self._last_request_time: Dict[str, float] = {}  # Per host, so different sites don't wait on each other
+        self._host_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._semaphore = asyncio.Semaphore(4)  # Max in-flight requests
+        self.max_retries = 3
+        self.retry_backoff = 0.5  # Seconds, doubled on each retry
+        self._response_cache: TTLCache = TTLCache(maxsize=128, ttl=_RESPONSE_CACHE_TTL)
         
     async def __aenter__(self):
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the underlying HTTP client"""
         await self.client.aclose()
     
-    async def _rate_limit(self):
-        """Implement rate limiting to be respectful to servers"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
+    async def _rate_limit(self, url: str):
+        """Implement per-host rate limiting to be respectful to servers"""
+        host = urlparse(url).netloc
+        # Callers for the same host take turns, each waiting out the delay after the previous one;
+        # other hosts have their own lock and go straight through
+        async with self._host_locks[host]:
+            current_time = time.monotonic()
+            last_request = self._last_request_time.get(host)
+            
+            if last_request is not None and current_time - last_request < self.rate_limit_delay:
+                await asyncio.sleep(self.rate_limit_delay - (current_time - last_request))
+            
+            self._last_request_time[host] = time.monotonic()
+    
+    async def _get(self, url: str) -> httpx.Response:
+        """GET with bounded concurrency, retrying transient failures with exponential backoff"""
+        cached = self._response_cache.get(url)
+        if cached is not None:
+            return cached
         
-        self.last_request_time = time.time()
+        for attempt in range(self.max_retries):
+            last_attempt = attempt == self.max_retries - 1
+            try:
+                async with self._semaphore:
+                    response = await self.client.get(url)
+                if response.status_code == 200:
+                    self._response_cache[url] = response
+                if response.status_code not in _RETRY_STATUSES or last_attempt:
+                    return response
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            
+            await asyncio.sleep(self.retry_backoff * 2 ** attempt)
     
     async def scrape_standardbred_canada_entries(self, track: str, race_date: date) -> List[Dict]:
         """Scrape race entries from Standardbred Canada"""
-        await self._rate_limit()
+        # Build URL for Standardbred Canada entries
+        base_url = "https://standardbredcanada.ca/racing/entries"
+        await self._rate_limit(base_url)
         
         try:
-            # Build URL for Standardbred Canada entries
-            base_url = "https://standardbredcanada.ca/racing/entries"
-            
-            # Try different URL patterns
-            date_str = race_date.strftime("%Y-%m-%d")
-            
             # Method 1: Direct entries page
-            response = await self.client.get(base_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for track and date selection forms
-            track_options = soup.find_all('option')
-            date_options = soup.find_all('option')
-            
-            # Extract available tracks and dates
-            available_tracks = []
-            available_dates = []
-            
-            for option in track_options:
-                if option.get('value') and 'track' in option.get('value', '').lower():
-                    available_tracks.append(option.text.strip())
-            
-            for option in date_options:
-                if option.get('value') and re.match(r'\d{4}-\d{2}-\d{2}', option.get('value', '')):
-                    available_dates.append(option.text.strip())
-            
-            logger.info(f"Found {len(available_tracks)} tracks and {len(available_dates)} dates")
+            response = await self._get(base_url)
             
-            # Try to find race entries
-            entries = []
-            
-            # Look for race cards or entry tables
-            race_cards = soup.find_all(['div', 'table'], class_=re.compile(r'race|entry|card', re.I))
-            
-            for card in race_cards:
-                entry_data = self._parse_standardbred_entry_card(card)
-                if entry_data:
-                    entries.extend(entry_data)
-            
-            return entries
+            # Parsing is CPU-bound; keep it off the event loop so other fetches carry on meanwhile
+            return await asyncio.to_thread(self._parse_standardbred_entries_page, response.content)
             
         except Exception as e:
             logger.error(f"Error scraping Standardbred Canada entries: {e}")
             return []
     
+    def _parse_standardbred_entries_page(self, body: bytes) -> List[Dict]:
+        """Parse the Standardbred Canada entries page into entry dicts"""
+        soup = make_soup(body)
+        
+        # Count the track and date selection options; only logged, so skip the scan when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            track_count = 0
+            date_count = 0
+            
+            for option in soup.find_all('option'):
+                value = option.get('value')
+                if not value:
+                    continue
+                if 'track' in value.lower():
+                    track_count += 1
+                elif _DATE_VALUE_RE.match(value):
+                    date_count += 1
+            
+            logger.info(f"Found {track_count} tracks and {date_count} dates")
+        
+        # Try to find race entries
+        entries = []
+        
+        # Look for race cards or entry tables
+        race_cards = _CARD_SEL.select(soup)
+        
+        for card in race_cards:
+            entry_data = self._parse_standardbred_entry_card(card)
+            if entry_data:
+                entries.extend(entry_data)
+        
+        return entries
+    
     def _parse_standardbred_entry_card(self, card_element) -> List[Dict]:
         """Parse a race card element from Standardbred Canada"""
         entries = []
@@ -104,14 +396,14 @@ class RacingWebScraper:
             race_info = {}
             
             # Try to find race number
-            race_num_elem = card_element.find(text=re.compile(r'Race\s+\d+', re.I))
+            race_num_elem = card_element.find(text=_RACE_NUMBER_RE)
             if race_num_elem:
-                race_match = re.search(r'Race\s+(\d+)', race_num_elem, re.I)
+                race_match = _RACE_NUMBER_RE.search(race_num_elem)
                 if race_match:
                     race_info['race_number'] = int(race_match.group(1))
             
             # Try to find post time
-            time_elem = card_element.find(text=re.compile(r'\d{1,2}:\d{2}\s*(AM|PM)?', re.I))
+            time_elem = card_element.find(text=_POST_TIME_RE)
             if time_elem:
                 race_info['post_time'] = time_elem.strip()
             
@@ -119,7 +411,8 @@ class RacingWebScraper:
             entry_rows = card_element.find_all('tr')
             
             for row in entry_rows:
-                cells = row.find_all(['td', 'th'])
+                # Cells are direct children of the row; don't descend into nested markup
+                cells = row.find_all(['td', 'th'], recursive=False)
                 if len(cells) >= 3:  # Minimum cells for meaningful data
                     entry = self._parse_entry_row(cells)
                     if entry:
@@ -128,7 +421,7 @@ class RacingWebScraper:
             
             # Alternative: Look for div-based entries
             if not entries:
-                entry_divs = card_element.find_all('div', class_=re.compile(r'entry|horse', re.I))
+                entry_divs = _ENTRY_DIV_SEL.select(card_element)
                 for div in entry_divs:
                     entry = self._parse_entry_div(div)
                     if entry:
@@ -154,18 +447,23 @@ class RacingWebScraper:
                     continue
                 
                 # Try to identify data types
-                if re.match(r'^\d+$', text) and len(text) <= 2:
+                match = _ENTRY_CELL_RE.fullmatch(text)
+                if match is None:
+                    continue
+                kind = match.lastgroup
+                
+                if kind == 'position':
                     # Likely post position or program number
                     if 'post_position' not in entry:
                         entry['post_position'] = int(text)
                     elif 'program_number' not in entry:
                         entry['program_number'] = text
                 
-                elif re.match(r'^\d+-\d+$', text):
+                elif kind == 'odds':
                     # Likely odds format
                     entry['morning_line_odds'] = text
                 
-                elif re.match(r'^[A-Za-z\s]+$', text) and len(text) > 2:
+                elif kind == 'name':
                     # Likely name
                     if 'horse_name' not in entry:
                         entry['horse_name'] = text
@@ -174,13 +472,11 @@ class RacingWebScraper:
                     elif 'trainer' not in entry:
                         entry['trainer'] = text
                 
-                elif re.match(r'^\d+[MFG]?$', text):
+                else:
                     # Age and possibly sex
-                    age_match = re.match(r'^(\d+)([MFG]?)$', text)
-                    if age_match:
-                        entry['age'] = int(age_match.group(1))
-                        if age_match.group(2):
-                            entry['sex'] = age_match.group(2)
+                    entry['age'] = int(match.group('age'))
+                    if match.group('sex'):
+                        entry['sex'] = match.group('sex')
             
             # Only return if we have minimum required data
             if 'horse_name' in entry and 'post_position' in entry:
@@ -206,12 +502,12 @@ class RacingWebScraper:
                 entry['horse_name'] = horse_elem.get_text(strip=True)
             
             # Look for numbers that might be post positions
-            numbers = re.findall(r'\b\d+\b', text)
+            numbers = _NUMBER_RE.findall(text)
             if numbers:
                 entry['post_position'] = int(numbers[0])
             
             # Look for odds patterns
-            odds_match = re.search(r'\b\d+-\d+\b', text)
+            odds_match = _ODDS_IN_TEXT_RE.search(text)
             if odds_match:
                 entry['morning_line_odds'] = odds_match.group()
             
@@ -223,32 +519,37 @@ class RacingWebScraper:
     
     async def scrape_woodbine_races(self, race_date: date) -> List[Dict]:
         """Scrape race data from Woodbine Mohawk Park"""
-        await self._rate_limit()
+        cached = _woodbine_race_cache.get(race_date)
+        if cached and (race_date < date.today() or time.monotonic() - cached[0] < _WOODBINE_CACHE_TTL):
+            return cached[1]
+        
+        # Try different Woodbine URLs
+        urls_to_try = [
+            "https://woodbine.com/mohawk/racing/",
+            "https://woodbine.com/mohawk/entries/",
+            f"https://woodbine.com/mohawk/racing/{race_date.isoformat()}"
+        ]
+        await self._rate_limit(urls_to_try[0])
         
         try:
-            # Try different Woodbine URLs
-            urls_to_try = [
-                "https://woodbine.com/mohawk/racing/",
-                "https://woodbine.com/mohawk/entries/",
-                f"https://woodbine.com/mohawk/racing/{race_date.strftime('%Y-%m-%d')}"
-            ]
             
             races = []
             
-            for url in urls_to_try:
-                try:
-                    response = await self.client.get(url)
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Look for race data
-                    race_data = self._parse_woodbine_page(soup, race_date)
+            # Fetch every candidate at once but take them in priority order: the first URL with
+            # data wins, and the lower-priority fetches (possibly still retrying) are cancelled
+            tasks = [asyncio.ensure_future(self._scrape_woodbine_url(url, race_date)) for url in urls_to_try]
+            try:
+                for task in tasks:
+                    race_data = await task
                     if race_data:
                         races.extend(race_data)
-                        break  # Found data, no need to try other URLs
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to scrape {url}: {e}")
-                    continue
+                        break  # Found data, no need to wait for the other URLs
+            finally:
+                for task in tasks:
+                    task.cancel()
+            
+            if races:
+                _woodbine_race_cache[race_date] = (time.monotonic(), races)
             
             return races
             
@@ -256,112 +557,48 @@ class RacingWebScraper:
             logger.error(f"Error scraping Woodbine races: {e}")
             return []
     
-    def _parse_woodbine_page(self, soup: BeautifulSoup, race_date: date) -> List[Dict]:
-        """Parse Woodbine page for race data"""
-        races = []
-        
-        try:
-            # Look for JSON data in script tags
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                if script.string and ('race' in script.string.lower() or 'entry' in script.string.lower()):
-                    try:
-                        # Try to extract JSON data
-                        json_match = re.search(r'(\{.*\})', script.string)
-                        if json_match:
-                            data = json.loads(json_match.group(1))
-                            if isinstance(data, dict) and 'races' in data:
-                                races.extend(data['races'])
-                    except:
-                        continue
-            
-            # If no JSON found, try HTML parsing
-            if not races:
-                race_elements = soup.find_all(['div', 'section'], class_=re.compile(r'race', re.I))
-                for elem in race_elements:
-                    race_data = self._parse_woodbine_race_element(elem)
-                    if race_data:
-                        races.append(race_data)
-            
-        except Exception as e:
-            logger.error(f"Error parsing Woodbine page: {e}")
-        
-        return races
-    
-    def _parse_woodbine_race_element(self, element) -> Optional[Dict]:
-        """Parse a race element from Woodbine"""
-        try:
-            race = {}
-            
-            # Extract race number
-            race_num_elem = element.find(text=re.compile(r'Race\s+\d+', re.I))
-            if race_num_elem:
-                race_match = re.search(r'Race\s+(\d+)', race_num_elem, re.I)
-                if race_match:
-                    race['race_number'] = int(race_match.group(1))
-            
-            # Extract post time
-            time_elem = element.find(text=re.compile(r'\d{1,2}:\d{2}\s*(AM|PM)', re.I))
-            if time_elem:
-                race['post_time'] = time_elem.strip()
-            
-            # Extract entries
-            entries = []
-            entry_elements = element.find_all(['tr', 'div'], class_=re.compile(r'entry|horse', re.I))
-            
-            for entry_elem in entry_elements:
-                entry_data = self._parse_woodbine_entry(entry_elem)
-                if entry_data:
-                    entries.append(entry_data)
-            
-            if entries:
-                race['entries'] = entries
-            
-            return race if 'race_number' in race else None
-            
-        except Exception as e:
-            logger.error(f"Error parsing Woodbine race element: {e}")
-            return None
-    
-    def _parse_woodbine_entry(self, element) -> Optional[Dict]:
-        """Parse an entry element from Woodbine"""
+    async def _scrape_woodbine_url(self, url: str, race_date: date) -> List[Dict]:
+        """Fetch and parse a single Woodbine page"""
         try:
-            entry = {}
-            text = element.get_text(strip=True)
+            response = await self._get(url)
             
-            # Similar parsing logic as Standardbred Canada
-            # This would need to be customized based on Woodbine's actual HTML structure
-            
-            return entry if entry else None
+            # Parse off the event loop and outside the GIL in a worker process
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                _get_parse_pool(), _parse_woodbine_html, response.content, race_date
+            )
             
         except Exception as e:
-            logger.error(f"Error parsing Woodbine entry: {e}")
-            return None
+            logger.warning(f"Failed to scrape {url}: {e}")
+            return []
     
     async def scrape_live_odds(self, track_url: str) -> Dict[str, Any]:
         """Scrape live odds from track websites"""
-        await self._rate_limit()
+        await self._rate_limit(track_url)
         
         try:
-            response = await self.client.get(track_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            odds_data = {}
-            
-            # Look for odds tables or elements
-            odds_elements = soup.find_all(['table', 'div'], class_=re.compile(r'odd|bet|wager', re.I))
-            
-            for elem in odds_elements:
-                parsed_odds = self._parse_odds_element(elem)
-                if parsed_odds:
-                    odds_data.update(parsed_odds)
-            
-            return odds_data
+            response = await self._get(track_url)
+            return await asyncio.to_thread(self._parse_odds_page, response.content)
             
         except Exception as e:
             logger.error(f"Error scraping live odds: {e}")
             return {}
     
+    def _parse_odds_page(self, body: bytes) -> Dict[str, Any]:
+        """Parse a track page's odds blocks into a horse -> odds mapping"""
+        soup = make_soup(body)
+        odds_data = {}
+        
+        # Look for odds tables or elements
+        odds_elements = _ODDS_SEL.select(soup)
+        
+        for elem in odds_elements:
+            parsed_odds = self._parse_odds_element(elem)
+            if parsed_odds:
+                odds_data.update(parsed_odds)
+        
+        return odds_data
+    
     def _parse_odds_element(self, element) -> Dict[str, Any]:
         """Parse odds from an HTML element"""
         odds = {}
@@ -371,10 +608,10 @@ class RacingWebScraper:
             text = element.get_text()
             
             # Find odds patterns like "3-1", "5/2", "2.50"
-            odds_patterns = re.findall(r'\b\d+[-/]\d+\b|\b\d+\.\d+\b', text)
+            odds_patterns = _ANY_ODDS_RE.findall(text)
             
             # Find horse names (this would need refinement)
-            horse_names = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
+            horse_names = _CAPITALIZED_NAME_RE.findall(text)
             
             # Pair odds with horses if possible
             if len(odds_patterns) == len(horse_names):
@@ -388,59 +625,55 @@ class RacingWebScraper:
     
     async def test_scraping_capabilities(self) -> Dict[str, Any]:
         """Test scraping capabilities against various Ontario racing sites"""
-        results = {
-            'standardbred_canada': {'status': 'untested', 'data': []},
-            'woodbine_mohawk': {'status': 'untested', 'data': []},
-            'live_odds': {'status': 'untested', 'data': {}}
-        }
+        results = {}
         
-        # Test Standardbred Canada
-        try:
-            sc_data = await self.scrape_standardbred_canada_entries("Woodbine Mohawk Park", date.today())
-            results['standardbred_canada'] = {
-                'status': 'success' if sc_data else 'no_data',
-                'data': sc_data,
-                'count': len(sc_data)
-            }
-        except Exception as e:
-            results['standardbred_canada'] = {'status': 'error', 'error': str(e)}
-        
-        # Test Woodbine
-        try:
-            wb_data = await self.scrape_woodbine_races(date.today())
-            results['woodbine_mohawk'] = {
-                'status': 'success' if wb_data else 'no_data',
-                'data': wb_data,
-                'count': len(wb_data)
-            }
-        except Exception as e:
-            results['woodbine_mohawk'] = {'status': 'error', 'error': str(e)}
+        # The probes hit different hosts, so run them side by side
+        sc_data, wb_data, odds_data = await asyncio.gather(
+            self.scrape_standardbred_canada_entries("Woodbine Mohawk Park", date.today()),
+            self.scrape_woodbine_races(date.today()),
+            self.scrape_live_odds("https://woodbine.com/mohawk"),
+            return_exceptions=True
+        )
         
-        # Test live odds
-        try:
-            odds_data = await self.scrape_live_odds("https://woodbine.com/mohawk")
-            results['live_odds'] = {
-                'status': 'success' if odds_data else 'no_data',
-                'data': odds_data,
-                'count': len(odds_data)
-            }
-        except Exception as e:
-            results['live_odds'] = {'status': 'error', 'error': str(e)}
+        for key, data in (('standardbred_canada', sc_data), ('woodbine_mohawk', wb_data), ('live_odds', odds_data)):
+            if isinstance(data, Exception):
+                results[key] = {'status': 'error', 'error': str(data)}
+            else:
+                results[key] = {
+                    'status': 'success' if data else 'no_data',
+                    'data': data,
+                    'count': len(data)
+                }
         
         return results
 
-# Convenience functions
+# Convenience functions share one scraper so keep-alive connections and rate limiting carry across calls
+_shared_scraper: Optional[RacingWebScraper] = None
+
+def _get_scraper() -> RacingWebScraper:
+    global _shared_scraper
+    if _shared_scraper is None:
+        _shared_scraper = RacingWebScraper()
+    return _shared_scraper
+
+async def close_scraper():
+    """Close the shared scraper's HTTP client and the parse pool (called on app shutdown)"""
+    global _shared_scraper, _parse_pool
+    if _shared_scraper is not None:
+        await _shared_scraper.close()
+        _shared_scraper = None
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
 async def test_ontario_scraping():
     """Test scraping capabilities for Ontario racing data"""
-    async with RacingWebScraper() as scraper:
-        return await scraper.test_scraping_capabilities()
+    return await _get_scraper().test_scraping_capabilities()
 
 async def get_standardbred_entries(track: str, race_date: date):
     """Get entries from Standardbred Canada"""
-    async with RacingWebScraper() as scraper:
-        return await scraper.scrape_standardbred_canada_entries(track, race_date)
+    return await _get_scraper().scrape_standardbred_canada_entries(track, race_date)
 
 async def get_woodbine_races(race_date: date):
     """Get races from Woodbine"""
-    async with RacingWebScraper() as scraper:
-        return await scraper.scrape_woodbine_races(race_date) 
\ No newline at end of file
+    return await _get_scraper().scrape_woodbine_races(race_date)
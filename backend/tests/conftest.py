@@ -0,0 +1,114 @@
+import os
+
+# Point the app at a throwaway database before anything imports database.py
+os.environ["DATABASE_URL"] = "sqlite://"
+os.environ.setdefault("APP_ENV", "test")
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+import database
+from database import Base, SessionLocal
+from main import app
+from models import Driver, Horse, Race, RaceEntry, Trainer, Track
+from services.analytics_service import AnalyticsService
+from services.ontario_racing_api import OntarioRacingDataService
+from services.race_service import RaceService
+from services.trainer_service import TrainerService
+
+
+@pytest.fixture(scope="session")
+def engine():
+    # One shared in-memory connection, so sessions on FastAPI's worker threads see the test's rows
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+def _clear_caches():
+    TrainerService.clear_stats_cache()
+    TrainerService.invalidate_total()
+    AnalyticsService.clear_cache()
+    RaceService.clear_tracks_cache()
+    OntarioRacingDataService._cache.clear()
+    OntarioRacingDataService._page_cache.clear()
+    OntarioRacingDataService._dom_cache.clear()
+    OntarioRacingDataService._inflight.clear()
+    database._views_checked.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(engine):
+    _clear_caches()
+    yield
+    with engine.begin() as connection:
+        for model_table in reversed(Base.metadata.sorted_tables):
+            connection.execute(model_table.delete())
+    _clear_caches()
+
+
+@pytest.fixture
+def db(engine):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(engine):
+    # Not entered as a context manager: the startup schema check expects an Alembic-managed database
+    return TestClient(app)
+
+
+class Factory:
+    """Minimal rows for API tests; every helper commits so request threads can read them"""
+
+    def __init__(self, db):
+        self.db = db
+        self._serial = 0
+
+    def _next(self) -> int:
+        self._serial += 1
+        return self._serial
+
+    def _save(self, obj):
+        self.db.add(obj)
+        self.db.commit()
+        return obj
+
+    def track(self, name: str = "Woodbine Mohawk Park", **fields):
+        return self._save(Track(name=name, location=fields.pop("location", "Milton, ON"), **fields))
+
+    def horse(self, name: str, **fields):
+        return self._save(Horse(name=name, registration_number=f"H{self._next()}", **fields))
+
+    def driver(self, name: str, **fields):
+        return self._save(Driver(name=name, license_number=f"D{self._next()}", **fields))
+
+    def trainer(self, name: str, **fields):
+        return self._save(Trainer(name=name, license_number=f"T{self._next()}", **fields))
+
+    def race(self, track, race_date: date, race_number: int, **fields):
+        fields.setdefault("post_time", datetime.combine(race_date, datetime.min.time()).replace(hour=18))
+        fields.setdefault("status", "finished")
+        return self._save(Race(track_id=track.id, race_date=race_date, race_number=race_number, **fields))
+
+    def entry(self, race, horse, driver, trainer, **fields):
+        fields.setdefault("post_position", 1)
+        if "earnings" in fields:
+            fields["earnings"] = Decimal(str(fields["earnings"]))
+        return self._save(RaceEntry(race_id=race.id, horse_id=horse.id, driver_id=driver.id,
+                                    trainer_id=trainer.id, **fields))
+
+
+@pytest.fixture
+def make(db):
+    return Factory(db)
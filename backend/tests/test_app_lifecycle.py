@@ -0,0 +1,35 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from main import app
+from services import analytics_service
+
+
+def test_shutdown_closes_the_dashboard_pool(engine, monkeypatch):
+    # create_all databases skip the startup revision check
+    monkeypatch.setenv("CREATE_TABLES", "1")
+    with TestClient(app):
+        pool = analytics_service._get_dashboard_pool()
+    assert analytics_service._dashboard_pool is None
+    assert pool._shutdown
+
+
+def test_concurrent_first_dashboards_share_one_pool(monkeypatch):
+    created = []
+
+    def slow_pool(**kwargs):
+        # Widen the window between the None check and the assignment
+        time.sleep(0.05)
+        created.append(ThreadPoolExecutor(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(analytics_service, "_dashboard_pool", None)
+    monkeypatch.setattr(analytics_service, "ThreadPoolExecutor", slow_pool)
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        pools = list(callers.map(lambda _: analytics_service._get_dashboard_pool(), range(4)))
+    analytics_service.close_dashboard_pool()
+
+    assert len(created) == 1
+    assert all(pool is created[0] for pool in pools)
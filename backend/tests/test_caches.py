@@ -0,0 +1,115 @@
+from datetime import date
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+from services.analytics_service import AnalyticsService
+from services.race_service import RaceService
+from services.trainer_service import TrainerService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _start(make, trainer, finish_position):
+    track = make.track()
+    race = make.race(track, date(2026, 10, 1), 1)
+    make.entry(race, make.horse("Pacer"), make.driver("Reins"), trainer,
+               finish_position=finish_position, earnings=1000)
+
+
+def test_trainer_stats_are_cached_until_invalidated(db, make):
+    trainer = make.trainer("Casie Coleman")
+    _start(make, trainer, 1)
+    service = TrainerService()
+    assert service.get_trainer_stats(db, trainer.id).wins == 1
+
+    _start(make, trainer, 1)
+    assert service.get_trainer_stats(db, trainer.id).wins == 1
+
+    TrainerService.invalidate_trainer(trainer.id)
+    assert service.get_trainer_stats(db, trainer.id).wins == 2
+
+
+def test_trainer_stats_expire_after_ttl(db, make, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(TrainerService, "_stats_cache", TTLCache(maxsize=16, ttl=300, timer=clock))
+    trainer = make.trainer("Casie Coleman")
+    service = TrainerService()
+    assert service.get_trainer_stats(db, trainer.id).total_starts == 0
+
+    _start(make, trainer, 2)
+    clock.now = 299
+    assert service.get_trainer_stats(db, trainer.id).total_starts == 0
+    clock.now = 301
+    assert service.get_trainer_stats(db, trainer.id).total_starts == 1
+
+
+def test_total_trainers_drops_on_committed_trainer_changes(db, make):
+    service = TrainerService()
+    make.trainer("Casie Coleman")
+    assert service.get_total_trainers(db) == 1
+
+    make.trainer("Richard Moreau")
+    assert service.get_total_trainers(db) == 2
+
+
+def test_total_trainers_survives_rolled_back_changes(db, make):
+    service = TrainerService()
+    trainer = make.trainer("Casie Coleman")
+    assert service.get_total_trainers(db) == 1
+
+    trainer.active = False
+    db.flush()
+    db.rollback()
+    # A later commit that touches no trainer must not drop the count either
+    make.horse("Pacer")
+    assert hashkey("active") in TrainerService._total_cache
+
+
+def test_dashboard_is_cached_until_cleared(client, make):
+    make.horse("Pacer")
+    assert client.get("/api/analytics/dashboard").json()["total_horses"] == 1
+
+    make.horse("Trotter")
+    assert client.get("/api/analytics/dashboard").json()["total_horses"] == 1
+
+    AnalyticsService.clear_cache()
+    assert client.get("/api/analytics/dashboard").json()["total_horses"] == 2
+
+
+def test_dashboard_totals_include_inactive_rows(client, make):
+    # Matches the table-wide planner estimate used on Postgres
+    make.horse("Pacer")
+    make.horse("Retired", active=False)
+    make.driver("Retired Driver", active=False)
+    dashboard = client.get("/api/analytics/dashboard").json()
+    assert (dashboard["total_horses"], dashboard["total_drivers"]) == (2, 1)
+
+
+def test_trends_are_cached_per_period(client, make):
+    track = make.track()
+    make.race(track, date.today(), 1, purse=10000)
+    week = client.get("/api/analytics/trends", params={"period": "week"}).json()
+    assert week["data"][0]["race_count"] == 1
+
+    make.race(track, date.today(), 2, purse=10000)
+    assert client.get("/api/analytics/trends", params={"period": "week"}).json() == week
+    month = client.get("/api/analytics/trends", params={"period": "month"}).json()
+    assert month["data"][0]["race_count"] == 2
+
+
+def test_tracks_are_cached_until_cleared(client, make):
+    make.track("Woodbine Mohawk Park")
+    assert len(client.get("/api/tracks").json()) == 1
+
+    make.track("Western Fair Raceway")
+    assert len(client.get("/api/tracks").json()) == 1
+
+    RaceService.clear_tracks_cache()
+    assert len(client.get("/api/tracks").json()) == 2
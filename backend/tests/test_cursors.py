@@ -0,0 +1,99 @@
+from datetime import date, timedelta
+
+import pytest
+
+
+def _page_races(client, path, limit):
+    """Follow the races cursor to the end, returning every id in the order served"""
+    ids, params = [], {"limit": limit}
+    while True:
+        page = client.get(path, params=params).json()
+        ids.extend(race["id"] for race in page)
+        if len(page) < limit:
+            return ids
+        last = page[-1]
+        params = {"limit": limit, "after_date": last["race_date"],
+                  "after_race_number": last["race_number"], "after_id": last["id"]}
+
+
+def _page_by_name(client, path, limit):
+    ids, params = [], {"limit": limit}
+    while True:
+        page = client.get(path, params=params).json()
+        ids.extend(item["id"] for item in page)
+        if len(page) < limit:
+            return ids
+        params = {"limit": limit, "after_name": page[-1]["name"], "after_id": page[-1]["id"]}
+
+
+@pytest.fixture
+def races(make):
+    """Two tracks racing the same card numbers on the same days, so (date, number) ties need the id"""
+    mohawk, western = make.track("Woodbine Mohawk Park"), make.track("Western Fair Raceway")
+    start = date(2026, 10, 1)
+    return [
+        make.race(track, start + timedelta(days=day), number)
+        for day in range(3)
+        for number in (2, 1, 3)
+        for track in (mohawk, western)
+    ]
+
+
+@pytest.mark.parametrize("limit", [1, 4, 5, 18, 50])
+def test_race_pages_have_no_duplicates_or_gaps(client, races, limit):
+    everything = [race["id"] for race in client.get("/api/races", params={"limit": 100}).json()]
+    assert len(everything) == len(races)
+    assert _page_races(client, "/api/races", limit) == everything
+
+
+def test_race_cursor_resumes_after_tied_date_and_number(client, races):
+    first, second = client.get("/api/races", params={"limit": 2}).json()
+    assert (first["race_date"], first["race_number"]) == (second["race_date"], second["race_number"])
+    rest = client.get("/api/races", params={
+        "limit": 100, "after_date": first["race_date"],
+        "after_race_number": first["race_number"], "after_id": first["id"]
+    }).json()
+    assert rest[0]["id"] == second["id"]
+
+
+def test_recent_races_cursor_walks_newest_first(db, races):
+    from services.race_service import RaceService
+    service = RaceService()
+    everything = [race.id for race in service.get_recent_races(db, limit=100)]
+    seen, cursor = [], {}
+    while page := service.get_recent_races(db, limit=4, **cursor):
+        seen.extend(race.id for race in page)
+        last = page[-1]
+        cursor = {"after_date": last.race_date, "after_race_number": last.race_number, "after_id": last.id}
+    assert seen == everything
+    assert len(set(seen)) == len(races)
+
+
+@pytest.mark.parametrize("params", [
+    {"after_date": "2026-10-01"},
+    {"after_date": "2026-10-01", "after_race_number": 1},
+    {"after_id": 3},
+])
+def test_partial_race_cursor_is_rejected(client, races, params):
+    response = client.get("/api/races", params=params)
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("kind", ["horses", "drivers", "trainers"])
+def test_name_pages_have_no_duplicates_or_gaps(client, make, kind):
+    create = {"horses": make.horse, "drivers": make.driver, "trainers": make.trainer}[kind]
+    # Repeated names force the id tiebreak
+    for name in ["Zeta", "Alpha", "Mid", "Alpha", "Mid", "Alpha", "Beta"]:
+        create(name)
+    everything = [item["id"] for item in client.get(f"/api/{kind}", params={"limit": 100}).json()]
+    assert len(everything) == 7
+    for limit in (1, 2, 3, 7):
+        assert _page_by_name(client, f"/api/{kind}", limit) == everything
+
+
+@pytest.mark.parametrize("kind", ["horses", "drivers", "trainers"])
+@pytest.mark.parametrize("params", [{"after_name": "Alpha"}, {"after_id": 1}])
+def test_partial_name_cursor_is_rejected(client, kind, params):
+    response = client.get(f"/api/{kind}", params=params)
+    assert response.status_code == 422
+    assert "after_name" in response.json()["detail"]
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+from services.ontario_racing_api import OntarioRacingDataService
+
+
+class CountingFactory:
+    """Factory returning successive values, optionally waiting on an event before each one"""
+
+    def __init__(self, *values, gate: asyncio.Event = None):
+        self.values = list(values)
+        self.calls = 0
+        self.gate = gate
+
+    async def __call__(self):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return self.values.pop(0)
+
+
+def _run(test):
+    async def wrapper():
+        service = OntarioRacingDataService()
+        try:
+            await test(service)
+        finally:
+            await service.close()
+    asyncio.run(wrapper())
+
+
+def test_fresh_entries_are_served_from_cache():
+    async def test(service):
+        factory = CountingFactory(["first"], ["second"])
+        assert await service._cached("key", factory) == ["first"]
+        assert await service._cached("key", factory) == ["first"]
+        assert factory.calls == 1
+    _run(test)
+
+
+def test_empty_results_are_not_cached():
+    async def test(service):
+        factory = CountingFactory([], ["data"])
+        assert await service._cached("key", factory) == []
+        assert await service._cached("key", factory) == ["data"]
+        assert factory.calls == 2
+    _run(test)
+
+
+def test_concurrent_misses_share_one_fetch():
+    async def test(service):
+        gate = asyncio.Event()
+        factory = CountingFactory(["shared"], gate=gate)
+        callers = [asyncio.ensure_future(service._cached("key", factory)) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*callers) == [["shared"]] * 5
+        assert factory.calls == 1
+        assert "key" not in service._inflight
+    _run(test)
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_fetch():
+    async def test(service):
+        gate = asyncio.Event()
+        factory = CountingFactory(["shared"], gate=gate)
+        impatient = asyncio.ensure_future(service._cached("key", factory))
+        patient = asyncio.ensure_future(service._cached("key", factory))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        gate.set()
+        assert await patient == ["shared"]
+        assert impatient.cancelled()
+    _run(test)
+
+
+def test_stale_entries_are_served_while_refreshing():
+    async def test(service):
+        service._cache["key"] = (["stale"], time.monotonic() - service._cache_ttl - 1)
+        gate = asyncio.Event()
+        factory = CountingFactory(["fresh"], gate=gate)
+
+        assert await service._cached("key", factory, stale_while_revalidate=True) == ["stale"]
+        # A second caller during the refresh gets the stale copy without starting another fetch
+        assert await service._cached("key", factory, stale_while_revalidate=True) == ["stale"]
+        gate.set()
+        await service._inflight["key"]
+        assert await service._cached("key", factory, stale_while_revalidate=True) == ["fresh"]
+        assert factory.calls == 1
+    _run(test)
+
+
+def test_entries_past_the_stale_window_wait_for_a_fetch():
+    async def test(service):
+        service._cache["key"] = (["ancient"], time.monotonic() - 2 * service._cache_ttl - 1)
+        factory = CountingFactory(["fresh"])
+        assert await service._cached("key", factory, stale_while_revalidate=True) == ["fresh"]
+    _run(test)
+
+
+def test_without_stale_while_revalidate_expired_entries_are_refetched():
+    async def test(service):
+        service._cache["key"] = (["old"], time.monotonic() - service._cache_ttl - 1)
+        factory = CountingFactory(["fresh"])
+        assert await service._cached("key", factory) == ["fresh"]
+    _run(test)
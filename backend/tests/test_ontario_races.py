@@ -0,0 +1,51 @@
+import asyncio
+from datetime import date
+
+from services.ontario_racing_api import OntarioRacingDataService, Race
+
+
+def _race(number: int, source: str, track: str = "Woodbine Mohawk Park") -> Race:
+    return Race(race_number=number, track=track, date=date.today(), post_time="7:00 PM",
+                distance="1 Mile", surface="Fast", race_type="Pace", purse=10000.0,
+                conditions=source, entries=[])
+
+
+def _todays_races(standardbred_canada, woodbine):
+    async def run():
+        service = OntarioRacingDataService()
+        service._get_standardbred_canada_races = standardbred_canada
+        service._get_woodbine_races = woodbine
+        try:
+            return await service._fetch_todays_races()
+        finally:
+            await service.close()
+    return asyncio.run(run())
+
+
+def test_standardbred_canada_copy_wins_even_when_it_finishes_last():
+    async def standardbred_canada(race_date):
+        await asyncio.sleep(0.05)
+        return [_race(1, "sc"), _race(2, "sc")]
+
+    async def woodbine(race_date):
+        return [_race(2, "woodbine"), _race(3, "woodbine")]
+
+    races = _todays_races(standardbred_canada, woodbine)
+    assert [(race.race_number, race.conditions) for race in races] == [(1, "sc"), (2, "sc"), (3, "woodbine")]
+
+
+def test_failing_source_keeps_the_others():
+    async def standardbred_canada(race_date):
+        raise RuntimeError("upstream down")
+
+    async def woodbine(race_date):
+        return [_race(1, "woodbine")]
+
+    races = _todays_races(standardbred_canada, woodbine)
+    assert [(race.race_number, race.conditions) for race in races] == [(1, "woodbine")]
+
+
+def test_same_race_number_at_different_tracks_is_kept():
+    service = OntarioRacingDataService.__new__(OntarioRacingDataService)
+    races = [_race(1, "sc"), _race(1, "sc", track="Georgian Downs"), _race(1, "woodbine")]
+    assert service._deduplicate_races(races) == races[:2]
@@ -0,0 +1,61 @@
+from datetime import date
+
+import ormsgpack
+import pytest
+
+import main
+from main import MSGPACK_MEDIA_TYPE
+
+
+@pytest.fixture
+def race_card(make):
+    track = make.track()
+    horse, driver, trainer = make.horse("Pacer"), make.driver("Reins"), make.trainer("Barn")
+    race = make.race(track, date(2026, 10, 1), 1)
+    make.entry(race, horse, driver, trainer, finish_position=1, finish_time="1:52.40", earnings=5000)
+    return {"track": track, "horse": horse, "driver": driver, "trainer": trainer}
+
+
+@pytest.mark.parametrize("path", ["/api/races", "/api/horses/{horse}/races"])
+def test_msgpack_body_matches_json(client, race_card, path):
+    path = path.format(horse=race_card["horse"].id)
+    as_json = client.get(path)
+    as_msgpack = client.get(path, headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert as_msgpack.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert ormsgpack.unpackb(as_msgpack.content) == as_json.json()
+    assert as_json.headers["content-type"].startswith("application/json")
+    for response in (as_json, as_msgpack):
+        assert "Accept" in response.headers["vary"]
+
+
+def test_json_when_msgpack_is_unavailable(client, race_card, monkeypatch):
+    monkeypatch.setattr(main, "ormsgpack", None)
+    response = client.get("/api/races", headers={"Accept": MSGPACK_MEDIA_TYPE})
+    assert response.headers["content-type"].startswith("application/json")
+    assert len(response.json()) == 1
+
+
+@pytest.mark.parametrize("kind", ["horse", "driver", "trainer", "track"])
+def test_detail_answers_304_for_a_matching_etag(client, race_card, kind):
+    path = f"/api/{kind}s/{race_card[kind].id}"
+    first = client.get(path)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=30"
+
+    revalidated = client.get(path, headers={"If-None-Match": f'"stale", {etag}'})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+
+def test_etag_changes_with_the_body(client, db, race_card):
+    path = f"/api/horses/{race_card['horse'].id}"
+    etag = client.get(path).headers["etag"]
+
+    race_card["horse"].color = "Bay"
+    db.commit()
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["color"] == "Bay"
@@ -0,0 +1,129 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+from sqlalchemy import func
+
+from models import Driver, Horse, Race, RaceEntry, Trainer, finish_time_to_cs
+from services import data_fetcher
+from services.data_fetcher import DataFetcher
+from services.trainer_service import TrainerService
+
+
+def _seed(db):
+    async def run():
+        fetcher = DataFetcher()
+        try:
+            return await fetcher.generate_and_store_sample_data(db)
+        finally:
+            await fetcher.close()
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def seeded(db, monkeypatch):
+    # A small chunk size so the entry inserts span several executemany batches
+    monkeypatch.setattr(data_fetcher, "BULK_CHUNK", 7)
+    result = _seed(db)
+    assert result["success"], result.get("error")
+    return result["statistics"]
+
+
+def test_statistics_match_stored_rows(db, seeded):
+    assert seeded["races_created"] == db.query(func.count(Race.id)).scalar() > 0
+    assert seeded["entries_created"] == db.query(func.count(RaceEntry.id)).scalar() > 0
+    assert seeded["horses_created"] == db.query(func.count(Horse.id)).scalar()
+    assert seeded["drivers_created"] == db.query(func.count(Driver.id)).scalar()
+    assert seeded["trainers_created"] == db.query(func.count(Trainer.id)).scalar()
+
+
+def test_license_numbers_are_unique(db, seeded):
+    for model in (Driver, Trainer):
+        licenses = [row.license_number for row in db.query(model.license_number)]
+        assert len(set(licenses)) == len(licenses)
+
+
+def test_race_cards_are_numbered_from_one(db, seeded):
+    cards = defaultdict(list)
+    for race in db.query(Race):
+        cards[(race.track_id, race.race_date)].append(race.race_number)
+    for numbers in cards.values():
+        assert sorted(numbers) == list(range(1, len(numbers) + 1))
+
+
+def test_entries_are_consistent_with_their_race(db, seeded):
+    horses_by_race = defaultdict(list)
+    rows = db.query(RaceEntry, Race.status).join(Race).all()
+    for entry, status in rows:
+        horses_by_race[entry.race_id].append(entry.horse_id)
+        assert entry.finish_time_cs == finish_time_to_cs(entry.finish_time)
+        if status == "finished":
+            assert entry.finish_position is not None
+        else:
+            assert entry.finish_position is None and entry.finish_time is None
+    for horse_ids in horses_by_race.values():
+        assert len(set(horse_ids)) == len(horse_ids)
+        assert 6 <= len(horse_ids) <= 10
+
+
+def test_reseeding_replaces_previous_data(db, seeded):
+    second = _seed(db)["statistics"]
+    assert second["trainers_created"] == db.query(func.count(Trainer.id)).scalar()
+    assert second["entries_created"] == db.query(func.count(RaceEntry.id)).scalar()
+
+
+def test_reseeding_refreshes_the_cached_trainer_total(db, make, seeded):
+    make.trainer("Retired Trainer")
+    service = TrainerService()
+    assert service.get_total_trainers(db) == seeded["trainers_created"] + 1
+
+    _seed(db)
+    assert service.get_total_trainers(db) == seeded["trainers_created"]
+
+
+def test_seeding_leaves_the_event_loop_free(db):
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        fetcher = DataFetcher()
+        ticking = asyncio.ensure_future(ticker())
+        try:
+            await asyncio.sleep(0)
+            result = await fetcher.generate_and_store_sample_data(db)
+        finally:
+            ticking.cancel()
+            await fetcher.close()
+        return result, ticks
+
+    result, ticks = asyncio.run(run())
+    assert result["success"]
+    assert ticks > 0
+
+
+def test_failed_seed_does_not_leave_a_partial_database(db, monkeypatch):
+    seed_track_races = DataFetcher._seed_track_races
+    seeded_tracks = []
+
+    def fail_after_first_track(self, bind, track_id, *args):
+        if seeded_tracks:
+            raise RuntimeError("track failed")
+        seeded_tracks.append(track_id)
+        # Keep going until a track actually commits races
+        result = seed_track_races(self, bind, track_id, *args)
+        if result == (0, 0):
+            seeded_tracks.clear()
+        return result
+
+    monkeypatch.setattr(DataFetcher, "_seed_track_races", fail_after_first_track)
+    result = _seed(db)
+
+    assert not result["success"]
+    assert seeded_tracks
+    for model in (RaceEntry, Race, Horse, Driver, Trainer):
+        assert db.query(func.count(model.id)).scalar() == 0
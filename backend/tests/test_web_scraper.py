@@ -0,0 +1,91 @@
+import asyncio
+import time
+from datetime import date
+
+import httpx
+import pytest
+
+from services import web_scraper
+from services.web_scraper import RacingWebScraper
+
+RACE_DATE = date(2026, 10, 1)
+RACING = "https://woodbine.com/mohawk/racing/"
+ENTRIES = "https://woodbine.com/mohawk/entries/"
+DATED = f"https://woodbine.com/mohawk/racing/{RACE_DATE.isoformat()}"
+
+
+def _page(*race_numbers) -> bytes:
+    races = ",".join(f'{{"race_number": {number}}}' for number in race_numbers)
+    return f'<html><script id="__NEXT_DATA__">{{"props": {{"races": [{races}]}}}}</script></html>'.encode()
+
+
+def _scrape(routes):
+    """Run scrape_woodbine_races against canned (delay, status, body) responses per URL"""
+    requested = []
+
+    async def handler(request):
+        url = str(request.url)
+        requested.append(url)
+        delay, status, body = routes[url]
+        await asyncio.sleep(delay)
+        return httpx.Response(status, content=body)
+
+    async def run():
+        scraper = RacingWebScraper()
+        await scraper.client.aclose()
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            started = time.monotonic()
+            races = await scraper.scrape_woodbine_races(RACE_DATE)
+            return races, time.monotonic() - started
+        finally:
+            await scraper.close()
+
+    races, elapsed = asyncio.run(run())
+    return races, elapsed, requested
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _parse_pool():
+    # Start the parser processes up front so their startup isn't counted in the timings
+    pool = web_scraper._get_parse_pool()
+    pool.submit(web_scraper._parse_woodbine_html, _page(1), RACE_DATE).result()
+    yield
+    asyncio.run(web_scraper.close_scraper())
+
+
+@pytest.fixture(autouse=True)
+def _clear_race_cache():
+    web_scraper._woodbine_race_cache.clear()
+    yield
+    web_scraper._woodbine_race_cache.clear()
+
+
+def test_failing_lower_priority_url_does_not_hold_up_the_result():
+    # /entries/ keeps answering 503, which would otherwise run through every retry and backoff
+    races, elapsed, requested = _scrape({
+        RACING: (0, 200, _page(1, 2)),
+        ENTRIES: (0, 503, b""),
+        DATED: (0.5, 200, _page(9)),
+    })
+    assert [race["race_number"] for race in races] == [1, 2]
+    assert elapsed < 0.4
+    assert requested.count(ENTRIES) < 3
+
+
+def test_higher_priority_url_wins_even_when_slower():
+    races, _, _ = _scrape({
+        RACING: (0.1, 200, _page(1)),
+        ENTRIES: (0, 200, _page(5)),
+        DATED: (0, 200, _page(9)),
+    })
+    assert [race["race_number"] for race in races] == [1]
+
+
+def test_falls_back_to_the_next_url_with_data():
+    races, _, _ = _scrape({
+        RACING: (0, 200, _page()),
+        ENTRIES: (0, 404, b""),
+        DATED: (0, 200, _page(7)),
+    })
+    assert [race["race_number"] for race in races] == [7]